@@ -0,0 +1,161 @@
+import sqlite3
+import sys
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    ended_at TEXT,
+    quarter_length INTEGER NOT NULL,
+    quarters INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS quarters (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    quarter INTEGER NOT NULL,
+    ended_at TEXT NOT NULL,
+    PRIMARY KEY (game_id, quarter)
+);
+CREATE TABLE IF NOT EXISTS penalties (
+    id INTEGER PRIMARY KEY,
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    quarter INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    team TEXT NOT NULL,
+    penalty_type TEXT NOT NULL,
+    game_time TEXT NOT NULL,
+    duration REAL NOT NULL,
+    released_at TEXT,
+    release TEXT
+);
+CREATE INDEX IF NOT EXISTS penalties_team ON penalties (team, duration);
+CREATE INDEX IF NOT EXISTS penalties_player ON penalties (player);
+CREATE INDEX IF NOT EXISTS penalties_type ON penalties (penalty_type);
+CREATE INDEX IF NOT EXISTS penalties_game ON penalties (game_id);
+"""
+
+
+class GameArchive:
+    """Every game, quarter and penalty ever timed, kept in a local SQLite database"""
+
+    def __init__(self, path="lacrosse_archive.db"):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        # WAL lets readers run alongside the app, NORMAL skips the fsync on every commit
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def now(self):
+        """Timestamp stored with games and quarters"""
+        return datetime.now().isoformat(timespec="seconds")
+
+    def start_game(self, quarter_length, quarters=4):
+        """Add a game and return its id"""
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO games (started_at, quarter_length, quarters) VALUES (?, ?, ?)",
+                (self.now(), quarter_length, quarters)
+            )
+        return cursor.lastrowid
+
+    def end_quarter(self, game_id, quarter):
+        """Note that a quarter finished"""
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO quarters (game_id, quarter, ended_at) VALUES (?, ?, ?)",
+                (game_id, quarter, self.now())
+            )
+
+    def end_game(self, game_id):
+        """Note that a game finished"""
+        with self.db:
+            self.db.execute("UPDATE games SET ended_at = ? WHERE id = ?", (self.now(), game_id))
+
+    def add_penalty(self, game_id, quarter, player, team, penalty_type, game_time, duration):
+        """Add a penalty as it starts and return its id"""
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO penalties (game_id, quarter, player, team, penalty_type, game_time, duration) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (game_id, quarter, player, team, penalty_type, game_time, duration)
+            )
+        return cursor.lastrowid
+
+    def update_penalty(self, penalty_id, **fields):
+        """Change the stored columns of a penalty, e.g. when the player number is filled in later"""
+        if not fields:
+            return
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self.db:
+            self.db.execute(f"UPDATE penalties SET {columns} WHERE id = ?", (*fields.values(), penalty_id))
+
+    def game_penalties(self, game_id):
+        """Every penalty in one game, in the order they were called"""
+        return self.db.execute(
+            "SELECT id, player, team, penalty_type, game_time, duration FROM penalties "
+            "WHERE game_id = ? ORDER BY id",
+            (game_id,)
+        ).fetchall()
+
+    def iter_penalty_rows(self, game_id=None):
+        """Report rows for every penalty (or one game's), read from the cursor as they are used"""
+        query = "SELECT player, team, penalty_type, game_time, duration FROM penalties"
+        params = ()
+        if game_id is not None:
+            query += " WHERE game_id = ?"
+            params = (game_id,)
+        for player, team, penalty_type, game_time, duration in self.db.execute(query + " ORDER BY id", params):
+            seconds = int(duration)
+            yield player, team, penalty_type, game_time, f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+    def penalty_minutes_by_team(self, game_id=None):
+        """Total penalty minutes per team, for one game or the whole archive"""
+        query = "SELECT team, SUM(duration) / 60.0 FROM penalties"
+        params = ()
+        if game_id is not None:
+            query += " WHERE game_id = ?"
+            params = (game_id,)
+        return self.db.execute(query + " GROUP BY team ORDER BY 2 DESC", params).fetchall()
+
+    def penalties_by_type(self):
+        """Number of penalties and penalty minutes per penalty type"""
+        return self.db.execute(
+            "SELECT penalty_type, COUNT(*), SUM(duration) / 60.0 FROM penalties "
+            "GROUP BY penalty_type ORDER BY 2 DESC"
+        ).fetchall()
+
+    def player_history(self, player, team=None):
+        """Every penalty a player has served, newest first"""
+        query = ("SELECT game_id, quarter, team, penalty_type, game_time, duration, release "
+                 "FROM penalties WHERE player = ?")
+        params = [player]
+        if team is not None:
+            query += " AND team = ?"
+            params.append(team)
+        return self.db.execute(query + " ORDER BY id DESC", params).fetchall()
+
+    def close(self):
+        """Close the database"""
+        self.db.close()
+
+
+def main(argv=None):
+    """Print season totals from the archive"""
+    argv = sys.argv[1:] if argv is None else argv
+    archive = GameArchive(argv[0] if argv else "lacrosse_archive.db")
+    games = archive.db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+    print(f"{games} games archived")
+
+    print("\nPenalty minutes by team")
+    for team, minutes in archive.penalty_minutes_by_team():
+        print(f"  {team or '(no team)':<24} {minutes:8.1f}")
+
+    print("\nPenalties by type")
+    for penalty_type, count, minutes in archive.penalties_by_type():
+        print(f"  {penalty_type:<24} {count:6d} {minutes:8.1f} min")
+    archive.close()
+
+
+if __name__ == "__main__":
+    main()
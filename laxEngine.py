@@ -0,0 +1,466 @@
+import heapq
+import time
+from array import array
+from itertools import compress, count
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, the array path covers everything
+    numpy = None
+
+
+class VirtualClock:
+    """A clock that only moves when told to, for tests and simulations"""
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Move the clock forward by the given number of seconds"""
+        self.now += seconds
+
+
+class PenaltyStore:
+    """Penalty timers kept as parallel arrays indexed by slot
+
+    Each timer index maps to a slot in the remaining-seconds and running-flag
+    arrays, so one tick can advance every running penalty in a single pass
+    instead of walking several dicts. Removed slots are reused. Pass
+    use_numpy=True to advance with vectorized numpy operations, which pays
+    off once there are hundreds of penalties; it falls back to the array
+    path when numpy is not installed.
+    """
+
+    __slots__ = ("use_numpy", "slots", "ids", "free", "size", "remaining", "running")
+
+    def __init__(self, use_numpy=False):
+        self.use_numpy = use_numpy and numpy is not None
+        self.clear()
+
+    def clear(self):
+        """Drop every penalty"""
+        self.slots = {}  # timer index -> slot
+        self.ids = []  # slot -> timer index, None when free
+        self.free = []  # slots available for reuse
+        self.size = 0  # slots handed out so far
+        if self.use_numpy:
+            self.remaining = numpy.zeros(16)
+            self.running = numpy.zeros(16, dtype=bool)
+        else:
+            self.remaining = array("d", bytes(8 * 16))
+            self.running = array("b", bytes(16))
+
+    def grow(self):
+        """Double the capacity of the slot arrays"""
+        capacity = len(self.remaining)
+        if self.use_numpy:
+            self.remaining = numpy.concatenate((self.remaining, numpy.zeros(capacity)))
+            self.running = numpy.concatenate((self.running, numpy.zeros(capacity, dtype=bool)))
+        else:
+            self.remaining.extend(array("d", bytes(8 * capacity)))
+            self.running.extend(array("b", bytes(capacity)))
+
+    def __contains__(self, index):
+        return index in self.slots
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __iter__(self):
+        return iter(self.slots)
+
+    def add(self, index, seconds=0):
+        """Track a timer index, reusing a free slot when there is one"""
+        if index in self.slots:
+            self.set(index, seconds)
+            return
+        if self.free:
+            slot = self.free.pop()
+            self.ids[slot] = index
+        else:
+            if self.size == len(self.remaining):
+                self.grow()
+            slot = self.size
+            self.size += 1
+            self.ids.append(index)
+        self.slots[index] = slot
+        self.remaining[slot] = seconds
+        self.running[slot] = False
+
+    def remove(self, index):
+        """Stop tracking a timer index and free its slot"""
+        slot = self.slots.pop(index, None)
+        if slot is None:
+            return
+        self.remaining[slot] = 0
+        self.running[slot] = False
+        self.ids[slot] = None
+        self.free.append(slot)
+
+    def get(self, index):
+        """Remaining seconds for a timer index"""
+        return float(self.remaining[self.slots[index]])
+
+    def set(self, index, seconds):
+        """Set the remaining seconds for a timer index"""
+        self.remaining[self.slots[index]] = seconds
+
+    def is_running(self, index):
+        """Whether a timer index is counting down"""
+        return bool(self.running[self.slots[index]])
+
+    def start(self, index):
+        """Mark a timer as running if it has time left"""
+        slot = self.slots[index]
+        if self.remaining[slot] > 0:
+            self.running[slot] = True
+
+    def stop(self, index):
+        """Mark a timer as paused"""
+        if index in self.slots:
+            self.running[self.slots[index]] = False
+
+    def running_indexes(self):
+        """Timer indexes that are counting down"""
+        return [self.ids[slot] for slot in compress(range(self.size), self.running)]
+
+    def stop_all(self):
+        """Pause every timer"""
+        if self.use_numpy:
+            self.running[:] = False
+        else:
+            self.running[:self.size] = array("b", bytes(self.size))
+
+    def advance(self, elapsed):
+        """Take elapsed seconds off every running timer and return the indexes that ran out"""
+        if self.use_numpy:
+            remaining = self.remaining[:self.size]
+            running = self.running[:self.size]
+            numpy.subtract(remaining, elapsed, out=remaining, where=running)
+            done = running & (remaining <= 0)
+            if not done.any():
+                return []
+            remaining[done] = 0
+            running[done] = False
+            return [self.ids[slot] for slot in numpy.flatnonzero(done)]
+
+        remaining = self.remaining
+        expired = []
+        for slot in compress(range(self.size), self.running):
+            value = remaining[slot] - elapsed
+            if value <= 0:
+                value = 0
+                self.running[slot] = False
+                expired.append(self.ids[slot])
+            remaining[slot] = value
+        return expired
+
+    def adjust_active(self, seconds):
+        """Shift every timer with time left, clamping at zero"""
+        for slot in self.slots.values():
+            if self.remaining[slot] > 0:  # only adjust active timers
+                self.remaining[slot] = max(0, self.remaining[slot] + seconds)
+                if self.remaining[slot] <= 0:
+                    self.running[slot] = False
+
+
+class GameClockEngine:
+    """Game clock and penalty timers with no dependency on Tkinter
+
+    Time is read from an injectable clock (time.monotonic by default) and
+    charged to the game clock and running penalties whenever the engine
+    settles. Listeners registered with subscribe() are called as
+    listener(event, data) for "started", "stopped", "quarter_end",
+    "game_over" and "penalty_expired".
+
+    Running penalties are also kept in a min-heap keyed by the game time
+    at which they expire, so the next one out is always at the top and
+    expiries fire exactly when the game clock reaches them. Entries are
+    invalidated lazily through expiry_generation rather than removed.
+    """
+
+    def __init__(self, quarter_length, clock=time.monotonic, quarters=4, use_numpy=False):
+        self.clock = clock
+        self.quarters = quarters
+        self.listeners = []
+        self.penalties = PenaltyStore(use_numpy)  # remaining penalty seconds as of the last settle
+        self.new_game(quarter_length)
+
+    def new_game(self, quarter_length):
+        """Reset to the start of quarter one with no penalties"""
+        self.quarter = 1
+        self.quarter_length = quarter_length
+        self.game_clock_time = quarter_length  # remaining seconds as of the last settle
+        self.running = False
+        self.paused_between_quarters = False
+        self.last_settle = 0.0
+        self.game_elapsed = 0.0  # seconds the game clock has run this game
+        self.penalties.clear()
+        self.timer_running_states = {}  # penalties to resume after a quarter break
+        self.clear_expiries()
+
+    def subscribe(self, listener):
+        """Register a callable to receive engine events"""
+        self.listeners.append(listener)
+
+    def emit(self, event, **data):
+        """Send an event to every listener"""
+        for listener in self.listeners:
+            listener(event, data)
+
+    # game clock
+
+    def start(self):
+        """Start the game clock, resuming penalties held over a quarter break"""
+        if self.running:
+            return
+        self.running = True
+        self.last_settle = self.clock()
+
+        if self.paused_between_quarters:
+            self.paused_between_quarters = False
+            for index, was_running in self.timer_running_states.items():
+                if was_running:
+                    self.start_penalty(index)
+        self.emit("started")
+
+    def stop(self):
+        """Stop the game clock; penalty timers pause with it"""
+        self.settle()
+        self.running = False
+        self.penalties.stop_all()
+        self.reindex_expiries()  # keeps the penalties held over a quarter break
+        self.emit("stopped")
+
+    def settle(self):
+        """Charge the time elapsed since the last settle to the game clock and running penalties"""
+        if not self.running:
+            return
+
+        now = self.clock()
+        # nothing runs past the end of the quarter
+        elapsed = min(now - self.last_settle, self.game_clock_time)
+        self.last_settle = now
+        self.game_clock_time -= elapsed
+        self.game_elapsed += elapsed
+
+        expired = dict.fromkeys(self.penalties.advance(elapsed))
+        heap = self.expiries
+        while heap and heap[0][0] <= self.game_elapsed + 1e-9:
+            expires_at, generation, index = heapq.heappop(heap)
+            if self.expiry_generation.get(index) == generation:
+                expired[index] = None
+
+        for index in expired:
+            self.expiry_generation.pop(index, None)
+            self.penalties.set(index, 0)
+            self.penalties.stop(index)
+        for index in expired:
+            self.emit("penalty_expired", index=index)
+
+    def tick(self):
+        """Settle and end the quarter if the game clock has run out"""
+        if not self.running:
+            return
+
+        self.settle()
+        if self.game_clock_time <= 0:
+            self.running = False
+            self.end_quarter()
+
+    def end_quarter(self):
+        """Hold running penalties over the break, or finish the game"""
+        if self.quarter < self.quarters:
+            # game time stands still over the break, so held penalties keep their heap entries
+            self.timer_running_states = {index: True for index in self.penalties.running_indexes()}
+            self.penalties.stop_all()
+            self.paused_between_quarters = True
+            self.emit("quarter_end", quarter=self.quarter)
+        else:
+            self.penalties.stop_all()
+            self.clear_expiries()
+            self.emit("game_over")
+
+    def next_quarter(self):
+        """Move to the next quarter, returning False if already in the last one"""
+        if self.quarter >= self.quarters:
+            return False
+        self.quarter += 1
+        self.game_clock_time = self.quarter_length
+        return True
+
+    def remaining(self):
+        """Seconds left in the quarter right now"""
+        if not self.running:
+            return self.game_clock_time
+        return max(0, self.game_clock_time - (self.clock() - self.last_settle))
+
+    def time_until_change(self, step):
+        """Seconds until the remaining time next crosses a multiple of step or a penalty expires"""
+        remaining = self.remaining()
+        delay = min(remaining % step or step, remaining)
+        upcoming = self.next_release()
+        if upcoming is not None and self.running:
+            delay = min(delay, upcoming[1])
+        return delay
+
+    def adjust_all(self, seconds):
+        """Add (or with a negative value subtract) time on the game clock and active penalties"""
+        self.settle()
+        self.game_clock_time = max(0, self.game_clock_time + seconds)
+        self.penalties.adjust_active(seconds)
+        self.reindex_expiries()
+
+    # expiry index
+
+    def clear_expiries(self):
+        """Forget every queued expiry"""
+        self.expiries = []  # heap of (game time of expiry, generation, index)
+        self.expiry_generation = {}  # index -> generation of its live heap entry
+        self.expiry_serial = count()
+
+    def queue_expiry(self, index):
+        """Queue a penalty's expiry at the game time it will run out"""
+        generation = next(self.expiry_serial)
+        self.expiry_generation[index] = generation
+        heapq.heappush(self.expiries, (self.game_elapsed + self.penalties.get(index), generation, index))
+
+        # drop stale entries once they outnumber the live ones
+        if len(self.expiries) > 2 * len(self.expiry_generation) + 32:
+            self.expiries = [entry for entry in self.expiries if self.expiry_generation.get(entry[2]) == entry[1]]
+            heapq.heapify(self.expiries)
+
+    def drop_expiry(self, index):
+        """Invalidate a penalty's queued expiry"""
+        self.expiry_generation.pop(index, None)
+
+    def reindex_expiries(self):
+        """Rebuild the expiry heap from the running and held penalties"""
+        queued = list(self.penalties.running_indexes())
+        if self.paused_between_quarters:
+            queued.extend(index for index in self.timer_running_states if index in self.penalties)
+        self.clear_expiries()
+        for index in queued:
+            if self.penalties.get(index) > 0:
+                self.queue_expiry(index)
+
+    def next_release(self):
+        """The (index, seconds left) of the next penalty to run out, or None"""
+        heap = self.expiries
+        while heap:
+            expires_at, generation, index = heap[0]
+            if self.expiry_generation.get(index) == generation:
+                elapsed = self.game_elapsed
+                if self.running:
+                    elapsed += min(self.clock() - self.last_settle, self.game_clock_time)
+                return index, max(0, expires_at - elapsed)
+            heapq.heappop(heap)
+        return None
+
+    # penalty timers
+
+    def add_penalty(self, index, seconds=0):
+        """Track a penalty timer slot"""
+        self.penalties.add(index, seconds)
+
+    def remove_penalty(self, index):
+        """Stop tracking a penalty timer slot"""
+        self.settle()
+        self.penalties.remove(index)
+        self.drop_expiry(index)
+        self.timer_running_states.pop(index, None)
+
+    def clear_penalties(self):
+        """Drop every penalty timer slot"""
+        self.settle()
+        self.penalties.clear()
+        self.timer_running_states = {}
+        self.clear_expiries()
+
+    def set_penalty(self, index, seconds):
+        """Set the remaining time on a penalty"""
+        self.settle()
+        self.penalties.set(index, seconds)
+        if seconds <= 0:
+            self.penalties.stop(index)
+            self.drop_expiry(index)
+        elif self.penalties.is_running(index) or (self.paused_between_quarters and index in self.timer_running_states):
+            # a penalty held over the break keeps its heap entry, so it moves with the new time too
+            self.queue_expiry(index)
+
+    def penalty_remaining(self, index):
+        """Seconds left on a penalty right now"""
+        remaining = self.penalties.get(index)
+        if self.running and self.penalties.is_running(index):
+            remaining = max(0, remaining - (self.clock() - self.last_settle))
+        return remaining
+
+    def start_penalty(self, index):
+        """Run a penalty with the game clock; ignored while the clock is stopped"""
+        if not self.running or index not in self.penalties:
+            return
+        self.settle()
+        self.penalties.start(index)
+        if self.penalties.is_running(index):
+            self.queue_expiry(index)
+
+    def stop_penalty(self, index):
+        """Pause a penalty"""
+        self.settle()
+        self.penalties.stop(index)
+        self.drop_expiry(index)
+
+    def start_all_penalties(self):
+        """Run every penalty with time left"""
+        if not self.running:
+            return
+        self.settle()
+        for index in self.penalties:
+            self.penalties.start(index)
+        self.reindex_expiries()
+
+    def stop_all_penalties(self):
+        """Pause every penalty"""
+        self.settle()
+        self.penalties.stop_all()
+        self.clear_expiries()
+
+    def release(self, index):
+        """Stop a penalty and clear its time"""
+        self.settle()
+        self.penalties.stop(index)
+        self.penalties.set(index, 0)
+        self.drop_expiry(index)
+
+
+def simulate_game(quarter_length=12 * 60, penalties=20, step=1.0):
+    """Play a full game against a VirtualClock, waking the way the UI does"""
+    clock = VirtualClock()
+    engine = GameClockEngine(quarter_length, clock=clock)
+    for index in range(penalties):
+        engine.add_penalty(index, 30 * (index % 10 + 1))
+
+    finished = []
+    engine.subscribe(lambda event, data: event == "game_over" and finished.append(True))
+
+    while not finished:
+        engine.start()
+        engine.start_all_penalties()
+        while engine.running:
+            clock.advance(engine.time_until_change(step))
+            engine.tick()
+        engine.next_quarter()
+    return engine
+
+
+if __name__ == "__main__":
+    # rough throughput check, runs without a display
+    games = 200
+    start = time.perf_counter()
+    for _ in range(games):
+        simulate_game()
+    elapsed = time.perf_counter() - start
+    print(f"{games} games in {elapsed:.3f}s ({games / elapsed:.0f} games/s)")
@@ -0,0 +1,484 @@
+import csv
+import glob
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from itertools import repeat
+
+REPORT_COLUMNS = ("Player Number", "Team Name", "Penalty Type", "Penalty Time", "Penalty Duration")
+ROW_FIELDS = ("player_number", "team_name", "penalty_type", "penalty_time", "penalty_duration")
+
+
+class ReportBuilder:
+    """Word game report kept up to date on a worker thread as penalties happen
+
+    python-docx only ever runs on the worker. The Tk thread sends it
+    immutable messages (a penalty's row as a tuple of strings, the game
+    summary as a fresh dict), so each penalty row is added to the table
+    when it happens and export() at the final horn only has to fill in the
+    summary and write the file.
+    """
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.sent = 0  # messages queued
+        self.handled = 0  # messages the worker has finished
+        self.exports = deque()  # (first, last) message counts of each queued export, oldest first
+        self.results = deque()  # ("saved", path) or ("error", message) of finished exports not yet taken
+        self.thread = threading.Thread(target=self.run, name="report-builder", daemon=True)
+        self.thread.start()
+
+    def send(self, *message):
+        """Queue a message for the worker"""
+        with self.lock:
+            self.sent += 1
+        self.queue.put(message)
+
+    def reset(self):
+        """Start an empty report for a new game"""
+        self.send("reset")
+
+    def set_penalty(self, key, values):
+        """Add a penalty's table row, or update it; None keeps a cell's current text"""
+        self.send("row", key, tuple(values))
+
+    def export(self, path, summary):
+        """Write the report to path once the worker has caught up"""
+        with self.lock:
+            self.exports.append((self.handled, self.sent + 1))
+        self.send("save", path, dict(summary))
+
+    def export_rows(self, path, summary, archive_path, game_id):
+        """Stream one game's penalties from the archive to a CSV, JSON Lines or HTML file"""
+        with self.lock:
+            self.exports.append((self.handled, self.sent + 1))
+        self.send("stream", path, dict(summary), archive_path, game_id)
+
+    def progress(self):
+        """Fraction of the oldest queued export done, or None when no export is queued"""
+        with self.lock:
+            if not self.exports:
+                return None
+            first, last = self.exports[0]
+            return (self.handled - first) / max(1, last - first)
+
+    def take_results(self):
+        """The outcomes of every export finished since the last call, each handed out once"""
+        with self.lock:
+            results = list(self.results)
+            self.results.clear()
+            return results
+
+    def run(self):
+        """Worker loop, owns the python-docx document"""
+        report = None
+        while True:
+            message = self.queue.get()
+            try:
+                # stream exports never touch the document, so they work without python-docx
+                if message[0] == "reset" or (report is None and message[0] in ("row", "save")):
+                    report = WordReport()
+                if message[0] == "row":
+                    report.set_row(message[1], message[2])
+                elif message[0] == "save":
+                    report.save(message[1], message[2])
+                    outcome = ("saved", message[1])
+                elif message[0] == "stream":
+                    stream_game(*message[1:])
+                    outcome = ("saved", message[1])
+            except Exception as e:
+                outcome = ("error", str(e))
+
+            with self.lock:
+                self.handled += 1
+                if message[0] in ("save", "stream"):
+                    self.exports.popleft()
+                    self.results.append(outcome)
+
+
+class WordReport:
+    """The python-docx document behind a ReportBuilder"""
+
+    def __init__(self):
+        # python-docx is only needed for reports, keep it off the startup path
+        from docx import Document
+
+        self.doc = Document()
+        self.rows = {}  # penalty key -> table row cells
+
+        # add title
+        self.doc.add_heading('Lacrosse Game Report', 0)
+
+        # add date and time, the generated time is filled in on save
+        self.doc.add_paragraph(f"Game Date: {datetime.now().strftime('%Y-%m-%d')}")
+        self.generated = self.doc.add_paragraph()
+
+        # add a horizontal line
+        self.doc.add_paragraph('_' * 50)
+
+        # game summary section, filled in on save
+        self.doc.add_heading('Game Summary', level=1)
+        self.quarters_played = self.doc.add_paragraph()
+        self.quarter_length = self.doc.add_paragraph()
+
+        # penalty summary
+        self.doc.add_heading('Penalty Summary', level=1)
+
+        # create a table for penalties
+        self.table = self.doc.add_table(rows=1, cols=len(REPORT_COLUMNS))
+        self.table.style = 'Table Grid'
+        for cell, title in zip(self.table.rows[0].cells, REPORT_COLUMNS):
+            cell.text = title
+
+        # add footer, penalty rows keep going into the table above it
+        self.doc.add_paragraph('_' * 50)
+        self.doc.add_paragraph('Generated by Lacrosse Timer App - © Dan Finn')
+
+    def set_row(self, key, values):
+        """Add or update one penalty row"""
+        cells = self.rows.get(key)
+        if cells is None:
+            cells = self.rows[key] = self.table.add_row().cells
+        for cell, value in zip(cells, values):
+            if value is not None and cell.text != value:
+                cell.text = value
+
+    def save(self, path, summary):
+        """Fill in the game summary and write the document"""
+        self.generated.text = f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        self.quarters_played.text, self.quarter_length.text = game_summary_lines(summary)
+        self.doc.save(path)
+
+
+def game_summary_lines(summary):
+    """The game summary lines every report format shows"""
+    return [
+        f"Total Quarters Played: {summary['quarter']}",
+        f"Quarter Length: {summary['quarter_length'] // 60} minutes"
+    ]
+
+
+def stream_game(path, summary, archive_path, game_id):
+    """Export one game's archived penalties, on whichever thread calls it"""
+    from laxArchive import GameArchive
+    
+    # a connection of its own, WAL lets it read while the app keeps writing
+    archive = GameArchive(archive_path)
+    try:
+        return export_rows(path, archive.iter_penalty_rows(game_id), game_summary_lines(summary))
+    finally:
+        archive.close()
+
+
+# minimal WordprocessingML package for the streaming writer
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+CONTENT_TYPES_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
+</Types>"""
+
+PACKAGE_RELS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+DOCUMENT_RELS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+STYLES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="{W_NAMESPACE}">
+<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:rPr><w:sz w:val="22"/></w:rPr></w:style>
+<w:style w:type="paragraph" w:styleId="Title"><w:name w:val="Title"/><w:basedOn w:val="Normal"/><w:pPr><w:spacing w:after="240"/></w:pPr><w:rPr><w:sz w:val="52"/></w:rPr></w:style>
+<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/><w:pPr><w:keepNext/><w:spacing w:before="240" w:after="120"/><w:outlineLvl w:val="0"/></w:pPr><w:rPr><w:b/><w:sz w:val="28"/></w:rPr></w:style>
+<w:style w:type="table" w:default="1" w:styleId="TableNormal"><w:name w:val="Normal Table"/><w:tblPr><w:tblCellMar><w:left w:w="108" w:type="dxa"/><w:right w:w="108" w:type="dxa"/></w:tblCellMar></w:tblPr></w:style>
+<w:style w:type="table" w:styleId="TableGrid"><w:name w:val="Table Grid"/><w:basedOn w:val="TableNormal"/><w:tblPr><w:tblBorders>
+<w:top w:val="single" w:sz="4" w:space="0" w:color="auto"/><w:left w:val="single" w:sz="4" w:space="0" w:color="auto"/>
+<w:bottom w:val="single" w:sz="4" w:space="0" w:color="auto"/><w:right w:val="single" w:sz="4" w:space="0" w:color="auto"/>
+<w:insideH w:val="single" w:sz="4" w:space="0" w:color="auto"/><w:insideV w:val="single" w:sz="4" w:space="0" w:color="auto"/>
+</w:tblBorders></w:tblPr></w:style>
+</w:styles>"""
+
+COLUMN_WIDTH = 1728  # twips, five columns across a 6 inch text width
+
+
+def xml_paragraph(text, escape, style=None):
+    """One paragraph of document.xml"""
+    style_xml = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f'<w:p>{style_xml}<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+
+def xml_row(values, escape):
+    """One table row of document.xml"""
+    cells = "".join(
+        f'<w:tc><w:tcPr><w:tcW w:w="{COLUMN_WIDTH}" w:type="dxa"/></w:tcPr>'
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(str(value))}</w:t></w:r></w:p></w:tc>'
+        for value in values
+    )
+    return f"<w:tr>{cells}</w:tr>"
+
+
+def stream_word_report(path, rows, summary_lines, title="Lacrosse Game Report", chunk_rows=1000):
+    """Write a Word report by streaming document.xml into the zip, one chunk of rows at a time
+
+    Produces the same layout as the python-docx report (title, dates,
+    summary, a 'Penalty Summary' Table Grid table and the footer) without
+    ever holding the document in memory, so rows can be any iterable of
+    five-value tuples, including a database cursor. Returns the row count.
+    """
+    import zipfile
+    from xml.sax.saxutils import escape
+    
+    count = 0
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+        package.writestr("_rels/.rels", PACKAGE_RELS_XML)
+        package.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS_XML)
+        package.writestr("word/styles.xml", STYLES_XML)
+        
+        with package.open("word/document.xml", "w") as document:
+            def write(text):
+                document.write(text.encode("utf-8"))
+            
+            write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<w:document xmlns:w="{W_NAMESPACE}"><w:body>')
+            write(xml_paragraph(title, escape, "Title"))
+            write(xml_paragraph(f"Game Date: {datetime.now().strftime('%Y-%m-%d')}", escape))
+            write(xml_paragraph(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", escape))
+            write(xml_paragraph('_' * 50, escape))
+            write(xml_paragraph("Game Summary", escape, "Heading1"))
+            for line in summary_lines:
+                write(xml_paragraph(line, escape))
+            write(xml_paragraph("Penalty Summary", escape, "Heading1"))
+            
+            # table properties and header, then the rows in chunks
+            write('<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:w="0" w:type="auto"/>'
+                  '<w:tblLook w:val="04A0"/></w:tblPr><w:tblGrid>')
+            write(f'<w:gridCol w:w="{COLUMN_WIDTH}"/>' * len(REPORT_COLUMNS) + "</w:tblGrid>")
+            write(xml_row(REPORT_COLUMNS, escape))
+            chunk = []
+            for values in rows:
+                chunk.append(xml_row(values, escape))
+                if len(chunk) >= chunk_rows:
+                    write("".join(chunk))
+                    count += len(chunk)
+                    chunk = []
+            write("".join(chunk))
+            count += len(chunk)
+            write("</w:tbl>")
+            
+            # add footer
+            write(xml_paragraph('_' * 50, escape))
+            write(xml_paragraph('Generated by Lacrosse Timer App - © Dan Finn', escape))
+            write('<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+                  '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440"/></w:sectPr></w:body></w:document>')
+    return count
+
+
+def text_rows(rows):
+    """Row pipeline stage: every value as text, so all writers see the same cells"""
+    for values in rows:
+        yield tuple("" if value is None else str(value) for value in values)
+
+
+def write_csv(path, rows, summary_lines=(), title=None):
+    """Write rows as CSV with a header line"""
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(REPORT_COLUMNS)
+        for values in rows:
+            writer.writerow(values)
+            count += 1
+    return count
+
+
+def write_jsonl(path, rows, summary_lines=(), title=None):
+    """Write rows as JSON Lines, one object per penalty"""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for values in rows:
+            f.write(json.dumps(dict(zip(ROW_FIELDS, values)), ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #000; padding: 4px 8px; text-align: left; }}
+th {{ background: #007BFF; color: white; }}
+</style></head><body>
+"""
+
+
+def write_html(path, rows, summary_lines=(), title="Lacrosse Game Report", chunk_rows=1000):
+    """Write rows as a self-contained HTML page, streamed a chunk of rows at a time"""
+    from xml.sax.saxutils import escape
+    
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HTML_HEAD.format(title=escape(title)))
+        f.write(f"<h1>{escape(title)}</h1>\n")
+        f.write(f"<p>Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>\n")
+        if summary_lines:
+            f.write("<h2>Game Summary</h2>\n")
+            f.writelines(f"<p>{escape(line)}</p>\n" for line in summary_lines)
+        f.write("<h2>Penalty Summary</h2>\n<table>\n<tr>")
+        f.write("".join(f"<th>{escape(column)}</th>" for column in REPORT_COLUMNS) + "</tr>\n")
+        chunk = []
+        for values in rows:
+            chunk.append("<tr>" + "".join(f"<td>{escape(value)}</td>" for value in values) + "</tr>\n")
+            if len(chunk) >= chunk_rows:
+                f.write("".join(chunk))
+                count += len(chunk)
+                chunk = []
+        f.write("".join(chunk))
+        count += len(chunk)
+        f.write("</table>\n<p>Generated by Lacrosse Timer App - © Dan Finn</p>\n</body></html>\n")
+    return count
+
+
+# export writers by file extension, each takes (path, rows, summary_lines, title) and returns the row count
+WRITERS = {
+    ".csv": write_csv,
+    ".jsonl": write_jsonl,
+    ".html": write_html,
+    ".docx": stream_word_report
+}
+
+
+def export_rows(path, rows, summary_lines=(), title="Lacrosse Game Report"):
+    """Stream penalty rows to path in the format its extension names"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"no exporter for {extension or 'files without an extension'}")
+    return WRITERS[extension](path, text_rows(rows), summary_lines, title=title)
+
+
+def duration_seconds(text):
+    """Seconds in an HH:MM:SS duration, or None for "Not in use" and other text"""
+    try:
+        hours, minutes, seconds = (int(part) for part in text.split(":"))
+    except ValueError:
+        return None
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def game_rows(state):
+    """Report rows for the timers of a saved game, skipping timers that were never used"""
+    for index, timer in sorted(state.get("timers", {}).items(), key=lambda item: int(item[0])):
+        player_number = timer.get("player_number", "")
+        team_name = timer.get("team_name", "")
+        penalty_type = timer.get("penalty_type", "Select Penalty Type")
+        if player_number or team_name or penalty_type != "Select Penalty Type":
+            yield player_number, team_name, penalty_type, timer.get("penalty_time", ""), timer.get("time_option", "")
+
+
+def write_season_totals(path, team_seconds):
+    """Write penalty minutes by team to a CSV or JSON Lines file of their own
+
+    The row-per-penalty formats have nowhere to put the summary lines the
+    Word and HTML season reports carry, so the totals go next to them.
+    """
+    totals = [(team, round(seconds / 60, 1)) for team, seconds in sorted(team_seconds.items(), key=lambda item: -item[1])]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            writer = csv.writer(f)
+            writer.writerow(("Team Name", "Penalty Minutes"))
+            writer.writerows(totals)
+        else:
+            for team, minutes in totals:
+                f.write(json.dumps({"team_name": team, "penalty_minutes": minutes}, ensure_ascii=False) + "\n")
+
+
+def render_game(path, out_dir, extension):
+    """Process pool task: write one saved game's report and hand back its rows for the season summary"""
+    from laxStore import read_snapshot
+    
+    name = os.path.splitext(os.path.basename(path))[0]
+    try:
+        state = read_snapshot(path)
+        rows = list(text_rows(game_rows(state)))
+        export_rows(os.path.join(out_dir, name + extension), rows, game_summary_lines({
+            "quarter": state.get("quarter", 1),
+            "quarter_length": state.get("quarter_length", 12 * 60)
+        }))
+    except Exception as e:
+        return name, None, str(e)
+    return name, rows, None
+
+
+def season_report(folder, out_dir, extension=".docx", workers=None):
+    """Render every saved game in folder across a process pool, then one combined season report"""
+    from concurrent.futures import ProcessPoolExecutor
+    
+    paths = sorted(glob.glob(os.path.join(folder, "*.json")) + glob.glob(os.path.join(folder, "*.lax")))
+    if not paths:
+        print(f"no saved games (*.json, *.lax) in {folder}")
+        return 0
+    os.makedirs(out_dir, exist_ok=True)
+    
+    started = time.perf_counter()
+    season_rows = []
+    team_seconds = {}
+    rendered = 0
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # a few chunks per worker keeps them all busy without a round trip per game
+        chunksize = max(1, len(paths) // (4 * workers))
+        for name, rows, error in pool.map(render_game, paths, repeat(out_dir), repeat(extension), chunksize=chunksize):
+            if error is not None:
+                print(f"{name}: skipped, {error}")
+                continue
+            rendered += 1
+            season_rows.extend(rows)
+            for row in rows:
+                seconds = duration_seconds(row[4])
+                if seconds is not None:
+                    team_seconds[row[1]] = team_seconds.get(row[1], 0) + seconds
+    
+    summary = [f"Games: {rendered}", f"Penalties: {len(season_rows)}"]
+    summary += [f"{team or '(no team)'}: {seconds / 60:.1f} penalty minutes"
+                for team, seconds in sorted(team_seconds.items(), key=lambda item: -item[1])]
+    export_rows(os.path.join(out_dir, "season_summary" + extension), season_rows, summary,
+                title="Lacrosse Season Report")
+    if extension in (".csv", ".jsonl"):
+        write_season_totals(os.path.join(out_dir, "season_totals" + extension), team_seconds)
+    
+    elapsed = time.perf_counter() - started
+    print(f"{rendered} games in {elapsed:.2f} s ({rendered / elapsed:.1f} games/s), reports in {out_dir}")
+    return rendered
+
+
+def main(argv=None):
+    """Write every archived penalty to one report without loading them into memory"""
+    from laxArchive import GameArchive
+    
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(f"usage: laxExport.py report{{{','.join(WRITERS)}}} [archive.db]")
+        return
+    archive = GameArchive(argv[1] if len(argv) > 1 else "lacrosse_archive.db")
+    games = archive.db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+    summary = [f"Games: {games}"]
+    summary += [f"{team or '(no team)'}: {minutes:.1f} penalty minutes" for team, minutes in archive.penalty_minutes_by_team()]
+    count = export_rows(argv[0], archive.iter_penalty_rows(), summary, title="Lacrosse Season Report")
+    archive.close()
+    print(f"{count} penalties written to {argv[0]}")
+
+
+if __name__ == "__main__":
+    main()
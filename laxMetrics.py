@@ -0,0 +1,146 @@
+import time
+from bisect import bisect_left
+
+# bucket upper bounds in seconds, 100 µs to 2 s
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0)
+
+
+class Histogram:
+    """Counts of observed values in fixed buckets, so recording costs the same all game long"""
+
+    __slots__ = ("name", "help", "bounds", "counts", "count", "total", "max")
+
+    def __init__(self, name, help, bounds=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.bounds = bounds
+        self.reset()
+
+    def reset(self):
+        """Forget every observation"""
+        self.counts = [0] * (len(self.bounds) + 1)  # the last bucket is everything above the bounds
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        """Count one value"""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of observations"""
+        if not self.count:
+            return 0.0
+        wanted = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= wanted:
+                return min(bound, self.max)
+        return self.max
+
+    def prometheus(self):
+        """The histogram in the Prometheus text exposition format"""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, count in zip(self.bounds, list(self.counts)):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{bound:g}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {self.total:.9f}")
+        lines.append(f"{self.name}_count {self.count}")
+        return "\n".join(lines)
+
+
+class TickMetrics:
+    """How late the master tick runs, how long it takes, and how far the clock on screen falls behind
+
+    Lateness is the time between the moment a tick was scheduled for and
+    the moment it ran. Drift is what that costs on screen: each time a new
+    game clock value is drawn, how long the value it replaces had stayed
+    up after the true game time moved past it. The engine itself cannot
+    drift from wall time, it reads the same clock, but a late tick, a slow
+    handler or a blocked event loop all leave a stale value showing.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.lateness = Histogram(
+            "lax_tick_lateness_seconds", "How long after its scheduled moment the master tick ran"
+        )
+        self.handler = Histogram("lax_tick_handler_seconds", "Time spent in the master tick handler")
+        self.drift = Histogram(
+            "lax_clock_drift_seconds",
+            "How long the game clock on screen showed a value after the game time had moved past it, per new value"
+        )
+        self.due = None  # when the pending tick should run
+        self.shown = None  # (field, text, lowest remaining time the text is right for) of the clock on screen
+        self.drift_now = {}  # field -> drift in seconds when its clock last changed on screen
+
+    def scheduled(self, delay):
+        """Note that the next tick is due in delay seconds"""
+        self.due = self.clock() + delay
+
+    def tick_started(self):
+        """Record how late this tick is and return its start time"""
+        now = self.clock()
+        if self.due is not None:
+            self.lateness.observe(max(0.0, now - self.due))
+            self.due = None
+        return now
+
+    def tick_finished(self, started):
+        """Record how long the tick took"""
+        self.handler.observe(self.clock() - started)
+
+    def sample_drift(self, field, text, valid_until, remaining):
+        """Note the game clock text just drawn for a running clock, with the true remaining time as it went up
+
+        valid_until is the lowest remaining time the text is right for.
+        When the text differs from the last one drawn, the old text has
+        been wrong since the remaining time passed its own valid_until.
+        """
+        shown, self.shown = self.shown, (field, text, valid_until)
+        if shown is None or shown[0] != field or shown[1] == text:
+            return
+        drift = max(0.0, shown[2] - remaining)
+        self.drift_now[field] = drift
+        self.drift.observe(drift)
+
+    def clock_changed(self, field):
+        """The field's clock started, stopped or was set, so its next value on screen is not a late one"""
+        if self.shown is not None and self.shown[0] == field:
+            self.shown = None
+
+    def reset(self):
+        """Start every measurement over"""
+        for histogram in (self.lateness, self.handler, self.drift):
+            histogram.reset()
+        self.shown = None
+        self.drift_now = {}
+
+    def prometheus(self):
+        """Every metric in the Prometheus text exposition format"""
+        lines = [self.lateness.prometheus(), self.handler.prometheus(), self.drift.prometheus()]
+        lines.append("# HELP lax_clock_drift_current_seconds Drift on screen when the field's clock last changed")
+        lines.append("# TYPE lax_clock_drift_current_seconds gauge")
+        for field, drift in dict(self.drift_now).items():
+            lines.append(f'lax_clock_drift_current_seconds{{field="{field}"}} {drift:.9f}')
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """A few lines for the debug overlay"""
+        lines = []
+        for label, histogram in (("tick late", self.lateness), ("tick took", self.handler)):
+            lines.append(
+                f"{label:<10} p50 {histogram.percentile(0.5) * 1000:7.2f} ms  "
+                f"p99 {histogram.percentile(0.99) * 1000:7.2f} ms  max {histogram.max * 1000:7.2f} ms"
+            )
+        for field, drift in self.drift_now.items():
+            lines.append(f"drift      {field}: {drift * 1000:7.2f} ms (worst {self.drift.max * 1000:.2f} ms)")
+        lines.append(f"ticks      {self.handler.count}")
+        return lines
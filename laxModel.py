@@ -0,0 +1,110 @@
+from bisect import bisect_left
+from types import MappingProxyType
+
+# the fields of a penalty timer and their values on a blank row
+TIMER_FIELDS = {
+    "player_number": "",
+    "team_name": "",
+    "penalty_type": "Select Penalty Type",
+    "penalty_time": "",
+    "time_option": "Not in use",
+    "archive_id": None  # penalty row in the archive while one is being served
+}
+
+EMPTY_RECORDS = MappingProxyType({})
+
+
+class TimerSnapshot:
+    """Every timer's fields at one moment, read-only and never changed afterwards"""
+
+    __slots__ = ("records", "order", "version")
+
+    def __init__(self, records, order, version):
+        self.records = records  # timer index -> read-only record of its fields
+        self.order = order  # timer indexes in display order, a tuple
+        self.version = version  # bumped on every change, for readers that cache
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def __contains__(self, index):
+        return index in self.records
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def get(self, index, default=None):
+        return self.records.get(index, default)
+
+
+class TimerStore:
+    """Penalty timer fields as immutable records, swapped in as a whole snapshot on each change
+
+    Only the Tk thread changes timers, and every change builds new records
+    and a new snapshot instead of editing the old ones. Taking
+    store.snapshot is one attribute read, so a saver, exporter or network
+    thread gets a consistent view of every timer in O(1) and can keep it
+    as long as it likes without locks or a trip through the UI thread.
+    Rows bind to the store: they are filled from it and write edits back
+    through update().
+
+    A change copies the index -> record map, which is cheap at the few
+    hundred timers a game can have.
+    """
+
+    def __init__(self):
+        self.snapshot = TimerSnapshot(EMPTY_RECORDS, (), 0)
+
+    # reads, from the current snapshot
+
+    def __getitem__(self, index):
+        return self.snapshot.records[index]
+
+    def __contains__(self, index):
+        return index in self.snapshot.records
+
+    def __len__(self):
+        return len(self.snapshot.order)
+
+    def __iter__(self):
+        return iter(self.snapshot.order)
+
+    @property
+    def order(self):
+        """Timer indexes in display order"""
+        return self.snapshot.order
+
+    # changes, each publishing a new snapshot
+
+    def publish(self, records, order):
+        """Swap in a new snapshot"""
+        self.snapshot = TimerSnapshot(MappingProxyType(records), order, self.snapshot.version + 1)
+
+    def add(self, index, **fields):
+        """Add a timer with blank fields apart from the ones given"""
+        records = dict(self.snapshot.records)
+        records[index] = MappingProxyType(dict(TIMER_FIELDS, **fields))
+        order = self.snapshot.order
+        if index not in self.snapshot.records:
+            position = bisect_left(order, index)
+            order = order[:position] + (index,) + order[position:]
+        self.publish(records, order)
+
+    def update(self, index, **fields):
+        """Change some of a timer's fields"""
+        records = dict(self.snapshot.records)
+        records[index] = MappingProxyType(dict(records[index], **fields))
+        self.publish(records, self.snapshot.order)
+
+    def remove(self, index):
+        """Forget a timer"""
+        records = dict(self.snapshot.records)
+        del records[index]
+        self.publish(records, tuple(other for other in self.snapshot.order if other != index))
+
+    def clear(self):
+        """Forget every timer"""
+        self.publish({}, ())
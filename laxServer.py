@@ -0,0 +1,313 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+
+SCOREBOARD_PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Lacrosse Scoreboard</title>
+<style>
+body { background: #000; color: #fff; font-family: Arial, sans-serif; margin: 0; padding: 1em; }
+.field { margin-bottom: 2em; }
+.clock { font-size: 12vw; font-weight: bold; }
+.quarter { font-size: 4vw; color: #FFD966; }
+.penalty { font-size: 3vw; }
+</style></head><body><div id="board"></div>
+<script>
+// the server sends the flat state once, then only the keys that changed
+const state = {};
+function draw() {
+  const fields = {};
+  for (const [key, value] of Object.entries(state)) {
+    const [field, ...path] = key.split("/");
+    (fields[field] = fields[field] || {penalties: {}});
+    if (path[0] === "penalty") {
+      (fields[field].penalties[path[1]] = fields[field].penalties[path[1]] || {})[path[2]] = value;
+    } else {
+      fields[field][path[0]] = value;
+    }
+  }
+  // names come from whoever typed them in, so they only ever go in as text
+  const board = document.getElementById("board");
+  board.replaceChildren(...Object.entries(fields).map(([name, f]) => {
+    const field = line("field", "");
+    field.append(line("quarter", `${name} \u00b7 Quarter ${f.quarter}`), line("clock", f.clock),
+      ...Object.values(f.penalties).map(p => line("penalty", `#${p.player} ${p.team} \u2014 ${p.remaining}`)));
+    return field;
+  }));
+}
+function line(className, text) {
+  const div = document.createElement("div");
+  div.className = className;
+  div.textContent = text;
+  return div;
+}
+new EventSource("/events").onmessage = (event) => {
+  const message = JSON.parse(event.data);
+  if (message.full) { for (const key in state) delete state[key]; Object.assign(state, message.full); }
+  Object.assign(state, message.set || {});
+  (message.del || []).forEach((key) => delete state[key]);
+  draw();
+};
+</script></body></html>
+"""
+
+
+def flatten(state, prefix="", flat=None):
+    """Nested dicts as one level of "a/b/c" keys, so deltas can name single values"""
+    if flat is None:
+        flat = {}
+    for key, value in state.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flatten(value, path + "/", flat)
+        else:
+            flat[path] = value
+    return flat
+
+
+class ScoreboardServer:
+    """Publishes the scoreboard to local displays as per-tick deltas
+
+    Runs its own asyncio loop on a background thread. Displays either open
+    the page at / (which follows /events, a server-sent event stream) or
+    connect over plain TCP and read newline-delimited JSON. Every client
+    first gets the full flat state, then one small message per published
+    change holding only the keys that changed or went away. Each message
+    is encoded once for all clients; a client too slow to drain its buffer
+    is dropped and picks up the full state when it reconnects.
+    """
+
+    def __init__(self, host="0.0.0.0", http_port=8765, tcp_port=8766, max_buffer=256 * 1024):
+        self.host = host
+        self.http_port = http_port
+        self.tcp_port = tcp_port
+        self.max_buffer = max_buffer  # bytes queued for one client before it is dropped
+        self.loop = None
+        self.thread = None
+        self.servers = []
+        self.current = {}  # flat state every client has been sent
+        self.seq = 0  # number of the last message published
+        self.tcp_clients = set()
+        self.sse_clients = set()
+        self.dropped = 0  # clients dropped for falling behind
+        self.metrics = None  # callable returning Prometheus text, served at /metrics
+
+    def start(self):
+        """Start serving on a background thread, returning once the ports are open"""
+        ready = threading.Event()
+        failure = []
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            try:
+                self.loop.run_until_complete(self.open())
+            except OSError as e:
+                failure.append(e)
+                ready.set()
+                return
+            ready.set()
+            self.loop.run_forever()
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name="scoreboard-server", daemon=True)
+        self.thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+        return self
+
+    async def open(self):
+        """Open the HTTP and TCP listeners"""
+        self.servers = [
+            await asyncio.start_server(self.handle_http, self.host, self.http_port),
+            await asyncio.start_server(self.handle_tcp, self.host, self.tcp_port)
+        ]
+
+    def publish(self, state):
+        """Hand a new scoreboard state to the server, safe to call from the Tk thread"""
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.apply, state)
+
+    def apply(self, state):
+        """Work out what changed since the last state and send just that to every client"""
+        flat = flatten(state)
+        changed = {key: value for key, value in flat.items() if self.current.get(key, self) != value}
+        removed = [key for key in self.current if key not in flat]
+        if not changed and not removed:
+            return
+        self.current = flat
+        self.seq += 1
+
+        message = {"seq": self.seq}
+        if changed:
+            message["set"] = changed
+        if removed:
+            message["del"] = removed
+        encoded = json.dumps(message, separators=(",", ":"))
+        self.broadcast(self.tcp_clients, (encoded + "\n").encode("utf-8"))
+        self.broadcast(self.sse_clients, f"data: {encoded}\n\n".encode("utf-8"))
+
+    def broadcast(self, clients, payload):
+        """Queue one payload on every client's transport, dropping clients that fall behind"""
+        for writer in list(clients):
+            if writer.transport.get_write_buffer_size() > self.max_buffer:
+                clients.discard(writer)
+                writer.close()
+                self.dropped += 1
+                continue
+            writer.write(payload)
+
+    def full_message(self):
+        """The whole current state, sent to a client as it connects"""
+        return json.dumps({"seq": self.seq, "full": self.current}, separators=(",", ":"))
+
+    async def handle_tcp(self, reader, writer):
+        """Plain TCP display: full state, then a JSON line per change until it hangs up"""
+        writer.write((self.full_message() + "\n").encode("utf-8"))
+        self.tcp_clients.add(writer)
+        try:
+            while await reader.read(1024):
+                pass  # displays only listen, anything they send is ignored
+        except ConnectionError:
+            pass
+        finally:
+            self.tcp_clients.discard(writer)
+            writer.close()
+
+    async def handle_http(self, reader, writer):
+        """Serve the scoreboard page, the full state, or the event stream of deltas"""
+        try:
+            request = await reader.readline()
+            while (await reader.readline()).strip():
+                pass  # headers are not needed
+        except ConnectionError:
+            writer.close()
+            return
+        parts = request.decode("latin-1").split()
+        path = parts[1] if len(parts) > 1 else "/"
+
+        if path == "/events":
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                         b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n")
+            writer.write(f"data: {self.full_message()}\n\n".encode("utf-8"))
+            self.sse_clients.add(writer)
+            try:
+                while await reader.read(1024):
+                    pass
+            except ConnectionError:
+                pass
+            finally:
+                self.sse_clients.discard(writer)
+                writer.close()
+            return
+
+        if path == "/":
+            status, content_type, body = "200 OK", "text/html; charset=utf-8", SCOREBOARD_PAGE
+        elif path == "/state":
+            status, content_type, body = "200 OK", "application/json", self.full_message()
+        elif path == "/metrics" and self.metrics is not None:
+            status, content_type, body = "200 OK", "text/plain; version=0.0.4", self.metrics()
+        else:
+            status, content_type, body = "404 Not Found", "text/plain", "not found"
+        body = body.encode("utf-8")
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    def clients(self):
+        """Number of connected displays"""
+        return len(self.tcp_clients) + len(self.sse_clients)
+
+    async def shutdown(self):
+        """Stop listening, hang up on every display and wait for their handlers to finish"""
+        for server in self.servers:
+            server.close()
+        for writer in self.tcp_clients | self.sse_clients:
+            writer.close()
+        # a closed connection hands its reader EOF, so every handler returns by itself
+        handlers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        if handlers:
+            await asyncio.wait(handlers, timeout=2.0)
+
+    def stop(self):
+        """Close every connection and stop the server thread"""
+        if self.loop is not None and self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop).result(5.0)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(5.0)
+
+
+def benchmark(clients=500, ticks=200, interval=0.1, penalties=8):
+    """Publish a ticking game to many TCP clients on localhost and report delivery latency"""
+    server = ScoreboardServer("127.0.0.1", 0, 0).start()
+    tcp_port = server.servers[1].sockets[0].getsockname()[1]
+    latencies = []
+    received = [0]
+
+    async def client(ready):
+        reader, writer = await asyncio.open_connection("127.0.0.1", tcp_port)
+        await reader.readline()  # the full state
+        ready.release()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            now = time.perf_counter()
+            sent = json.loads(line).get("set", {}).get("bench/sent")
+            if sent is not None:
+                latencies.append(now - sent)
+                received[0] += 1
+        writer.close()
+
+    async def run():
+        ready = asyncio.Semaphore(0)
+        tasks = [asyncio.create_task(client(ready)) for _ in range(clients)]
+        for _ in range(clients):
+            await ready.acquire()
+
+        started = time.perf_counter()
+        for tick in range(ticks):
+            clock = 720 - tick * interval
+            state = {
+                "bench": {"sent": time.perf_counter()},
+                "Field 1": {
+                    "quarter": 1,
+                    "clock": f"{int(clock) // 60:02d}:{int(clock) % 60:02d}",
+                    "penalty": {
+                        str(index): {"player": str(index), "team": "Hawks",
+                                     "remaining": f"{max(0, 60 * index - tick // 10)}"}
+                        for index in range(1, penalties + 1)
+                    }
+                }
+            }
+            server.publish(state)
+            await asyncio.sleep(interval)
+        await asyncio.sleep(0.5)
+        elapsed = time.perf_counter() - started
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return elapsed
+
+    elapsed = asyncio.run(run())
+    server.stop()
+    latencies.sort()
+    if not latencies:
+        print("no messages received")
+        return
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+    print(f"{clients} clients, {ticks} ticks in {elapsed:.1f} s, {received[0]} of {clients * ticks} deltas delivered, "
+          f"{server.dropped} clients dropped")
+    print(f"latency p50 {percentile(0.5):.2f} ms, p99 {percentile(0.99):.2f} ms, max {latencies[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,417 @@
+import multiprocessing
+import struct
+import time
+from multiprocessing import shared_memory
+
+from laxEngine import GameClockEngine
+
+# layout of the shared block: sequence counter, engine header, then one row per penalty
+STATE_SEQ = struct.Struct("<Q")
+STATE_HEADER = struct.Struct("<iiidddd??iII")  # quarter length in whole seconds, as the engine keeps it
+STATE_PENALTY = struct.Struct("<id??")
+MAX_PENALTIES = 4096
+STATE_SIZE = STATE_SEQ.size + STATE_HEADER.size + MAX_PENALTIES * STATE_PENALTY.size
+START_TIMEOUT = 10.0  # seconds for a spawned engine to publish its first state
+CALL_TIMEOUT = 5.0  # seconds an engine command may take before the engine counts as hung
+
+
+class SharedState:
+    """Engine state in a shared memory block, written by one process and read by others
+
+    Writes follow a seqlock: the counter is bumped to odd before the block
+    changes and back to even after, so a reader that sees the same even
+    value on both sides of its copy knows it read one consistent state
+    without ever taking a lock the writer could be held up by.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.seq = 0  # counter value of the cached state, odd values are never cached
+        self.header = None
+        self.rows = {}  # penalty index -> (remaining seconds as of the last settle, running, held over the break)
+        self.writer_alive = None  # callable, once it returns False a half-written state is never finished
+
+    def publish(self, engine, commands):
+        """Write the engine's settled state and the number of commands it has run"""
+        upcoming = engine.next_release()  # also drops stale entries from the top of the heap
+        next_index, expires_at = (upcoming[0], engine.expiries[0][0]) if upcoming is not None else (-1, 0.0)
+        penalties = engine.penalties
+        indexes = list(penalties)[:MAX_PENALTIES]
+
+        seq = STATE_SEQ.unpack_from(self.buffer, 0)[0]
+        STATE_SEQ.pack_into(self.buffer, 0, seq + 1)
+        STATE_HEADER.pack_into(
+            self.buffer, STATE_SEQ.size,
+            engine.quarter, engine.quarters, engine.quarter_length, engine.game_clock_time,
+            engine.last_settle, engine.game_elapsed, expires_at,
+            engine.running, engine.paused_between_quarters, next_index, len(indexes), commands
+        )
+        offset = STATE_SEQ.size + STATE_HEADER.size
+        held = engine.timer_running_states if engine.paused_between_quarters else {}
+        for index in indexes:
+            STATE_PENALTY.pack_into(
+                self.buffer, offset, index, penalties.get(index), penalties.is_running(index), index in held
+            )
+            offset += STATE_PENALTY.size
+        STATE_SEQ.pack_into(self.buffer, 0, seq + 2)
+
+    def read(self):
+        """Latest consistent state, re-read only when the writer has published since"""
+        while True:
+            seq = STATE_SEQ.unpack_from(self.buffer, 0)[0]
+            if seq == self.seq:
+                return self.header
+            if seq & 1:
+                if self.writer_alive is not None and not self.writer_alive():
+                    return self.header  # the engine died mid-write, the last whole state is all there is
+                time.sleep(0)  # mid-write, let the engine finish
+                continue
+            header = STATE_HEADER.unpack_from(self.buffer, STATE_SEQ.size)
+            start = STATE_SEQ.size + STATE_HEADER.size
+            rows = bytes(self.buffer[start:start + min(header[10], MAX_PENALTIES) * STATE_PENALTY.size])
+            if STATE_SEQ.unpack_from(self.buffer, 0)[0] == seq:
+                break
+
+        self.seq = seq
+        self.header = header
+        self.rows = {index: (remaining, running, held) for index, remaining, running, held in STATE_PENALTY.iter_unpack(rows)}
+        return header
+
+    def restore(self, quarter_length, quarters):
+        """A GameClockEngine in the last state read, or a new one if nothing was ever read"""
+        engine = GameClockEngine(quarter_length, quarters=quarters)
+        if self.header is None:
+            return engine
+        (engine.quarter, engine.quarters, engine.quarter_length, engine.game_clock_time, engine.last_settle,
+         engine.game_elapsed, _, engine.running, engine.paused_between_quarters, _, _, _) = self.header
+        for index, (remaining, running, held) in self.rows.items():
+            engine.penalties.add(index, remaining)
+            if running:
+                engine.penalties.start(index)
+            if held:
+                engine.timer_running_states[index] = True
+        engine.reindex_expiries()
+        return engine
+
+
+def run_engine(conn, name, quarter_length, quarters):
+    """Engine process: apply commands from the UI and keep the clock settled on its own"""
+    memory = shared_memory.SharedMemory(name=name)
+    state = SharedState(memory.buf)
+    engine = GameClockEngine(quarter_length, quarters=quarters)
+    events = []
+    engine.subscribe(lambda event, data: events.append((event, data)))
+    commands = 0
+    state.publish(engine, commands)
+
+    while True:
+        # wake for the next expiry or quarter end even if the UI never asks
+        timeout = engine.time_until_change(1.0) if engine.running else None
+        if conn.poll(timeout):
+            method, args = conn.recv()
+            if method == "close":
+                break
+            commands += 1
+            try:
+                if method == "assign":
+                    setattr(engine, *args)
+                    result = None
+                else:
+                    result = getattr(engine, method)(*args)
+                reply = ("reply", result)
+            except Exception as e:
+                reply = ("error", e)
+        else:
+            engine.tick()
+            reply = None
+
+        # publish before anything is sent, so the UI never reads older state than it was told about
+        state.publish(engine, commands)
+        for event, data in events:
+            conn.send(("event", event, data))
+        events.clear()
+        if reply is not None:
+            conn.send(reply)
+
+    conn.close()
+    memory.close()
+
+
+def shared_attribute(index):
+    """Engine attribute read from the shared state header and assigned through the engine process"""
+    return property(
+        lambda self: self.state.read()[index],
+        lambda self, value: self.assign(STATE_ATTRIBUTES[index], value)
+    )
+
+
+STATE_ATTRIBUTES = ["quarter", "quarters", "quarter_length", "game_clock_time"]
+
+
+class SharedEngine:
+    """Stand-in for GameClockEngine whose clock runs in a separate process
+
+    The engine process owns the official time and settles the clock and
+    penalties on its own schedule, so a modal dialog or slow save on the
+    Tk thread never holds the clock up. This side reads the published
+    state straight from shared memory and sends every change as a command,
+    waiting for its reply so the UI always sees the result of its own
+    actions. Engine events are queued in the pipe until the UI next calls
+    in, normally its next tick().
+
+    If the engine process fails to start, dies or stops answering, the
+    clock carries on in this process: a GameClockEngine is rebuilt from the
+    last state read and runs every later command, publishing to the same
+    shared block so reads work as before. take_failure() hands out the
+    reason once so the UI can say so.
+    """
+
+    quarter = shared_attribute(0)
+    quarters = shared_attribute(1)
+    quarter_length = shared_attribute(2)
+    game_clock_time = shared_attribute(3)
+
+    def __init__(self, quarter_length, quarters=4):
+        self.clock = time.monotonic  # same clock as the engine process
+        self.listeners = []
+        self.defaults = (quarter_length, quarters)  # for an engine that never published anything
+        self.sent = 0  # commands sent to the engine process
+        self.local = None  # engine running in this process once the engine process is lost
+        self.failure = None  # why it was lost, until take_failure() hands it out
+        self.memory = shared_memory.SharedMemory(create=True, size=STATE_SIZE)
+        self.memory.buf[:STATE_SEQ.size] = bytes(STATE_SEQ.size)
+        self.state = SharedState(self.memory.buf)
+
+        # spawn rather than fork, the Tk process has threads and an X connection a fork would copy
+        context = multiprocessing.get_context("spawn")
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=run_engine, args=(child, self.memory.name, quarter_length, quarters),
+            name="game-clock-engine", daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.state.writer_alive = self.process.is_alive
+
+        deadline = time.monotonic() + START_TIMEOUT
+        while self.state.read() is None:
+            if not self.process.is_alive():
+                self.take_over(f"engine process exited on start with code {self.process.exitcode}")
+                return
+            if time.monotonic() > deadline:
+                self.take_over("engine process did not start in time")
+                return
+            time.sleep(0.001)  # until the engine's first publish
+
+    def take_over(self, reason):
+        """Carry on with the clock in this process from the last state the engine published in full
+
+        Returns how many commands that state had run.
+        """
+        if self.process.is_alive():
+            self.process.kill()  # hung, it must not publish over the local engine
+            self.process.join(1.0)
+        self.conn.close()
+        header = self.state.read()
+        self.local = self.state.restore(*self.defaults)
+        self.local_events = []
+        self.local.subscribe(lambda event, data: self.local_events.append((event, data)))
+        self.failure = reason
+
+        # a write cut short leaves the counter odd, even it up so readers accept the next publish
+        seq = STATE_SEQ.unpack_from(self.state.buffer, 0)[0]
+        STATE_SEQ.pack_into(self.state.buffer, 0, seq + (seq & 1))
+        self.state.publish(self.local, self.sent)
+        return header[11] if header is not None else 0
+
+    def take_failure(self):
+        """Why the engine process was lost, handed out once, or None"""
+        failure, self.failure = self.failure, None
+        return failure
+
+    def call(self, method, *args):
+        """Run an engine method in the engine process and return its result"""
+        if self.local is None:
+            self.sent += 1
+            events = []
+            try:
+                self.conn.send((method, args))
+                while True:
+                    if not self.conn.poll(CALL_TIMEOUT):
+                        raise TimeoutError(f"no reply to {method} in {CALL_TIMEOUT:g} s")
+                    message = self.conn.recv()
+                    if message[0] != "event":
+                        break
+                    events.append(message[1:])
+            except (EOFError, OSError) as e:
+                ran = self.take_over(f"engine process lost ({type(e).__name__}: {e})")
+                # events that got through describe state the engine had already published
+                for event, data in events:
+                    self.emit(event, **data)
+                if ran >= self.sent:
+                    return None  # the engine ran the command but died before replying
+            else:
+                # listeners may call back into the engine, so they only run once this reply is in
+                for event, data in events:
+                    self.emit(event, **data)
+                if message[0] == "error":
+                    raise message[1]
+                return message[1]
+
+        if method == "assign":
+            result = setattr(self.local, *args)
+        else:
+            result = getattr(self.local, method)(*args)
+        self.state.publish(self.local, self.sent)
+        # as with the engine process, listeners only hear of events once the state they describe is published
+        events, self.local_events = self.local_events, []
+        for event, data in events:
+            self.emit(event, **data)
+        return result
+
+    def assign(self, name, value):
+        """Set an engine attribute in the engine process"""
+        self.call("assign", name, value)
+
+    def subscribe(self, listener):
+        """Register a callable to receive engine events"""
+        self.listeners.append(listener)
+
+    def emit(self, event, **data):
+        """Send an event to every listener"""
+        for listener in self.listeners:
+            listener(event, data)
+
+    def close(self):
+        """Stop the engine process and free the shared memory"""
+        if self.local is None:
+            try:
+                self.conn.send(("close", ()))
+            except OSError:
+                pass  # already gone
+            self.process.join(2.0)
+            self.conn.close()
+        self.state.buffer = None
+        self.memory.close()
+        self.memory.unlink()
+
+    # reads, from shared memory
+
+    @property
+    def running(self):
+        return self.state.read()[7]
+
+    @property
+    def paused_between_quarters(self):
+        return self.state.read()[8]
+
+    @property
+    def game_elapsed(self):
+        return self.state.read()[5]
+
+    def in_flight(self, header):
+        """Game seconds run since the engine last settled"""
+        if not header[7]:
+            return 0.0
+        return min(self.clock() - header[4], header[3])
+
+    def remaining(self):
+        """Seconds left in the quarter right now"""
+        header = self.state.read()
+        return max(0, header[3] - self.in_flight(header))
+
+    def penalty_remaining(self, index):
+        """Seconds left on a penalty right now"""
+        header = self.state.read()
+        remaining, running, _ = self.state.rows[index]
+        if header[7] and running:
+            remaining = max(0, remaining - (self.clock() - header[4]))
+        return remaining
+
+    def next_release(self):
+        """The (index, seconds left) of the next penalty to run out, or None"""
+        header = self.state.read()
+        if header[9] < 0:
+            return None
+        return header[9], max(0, header[6] - header[5] - self.in_flight(header))
+
+    def time_until_change(self, step):
+        """Seconds until the remaining time next crosses a multiple of step or a penalty expires"""
+        remaining = self.remaining()
+        delay = min(remaining % step or step, remaining)
+        upcoming = self.next_release()
+        if upcoming is not None and self.running:
+            delay = min(delay, upcoming[1])
+        return delay
+
+    # commands, run by the engine process
+
+    def new_game(self, quarter_length):
+        self.call("new_game", quarter_length)
+
+    def start(self):
+        self.call("start")
+
+    def stop(self):
+        self.call("stop")
+
+    def settle(self):
+        self.call("settle")
+
+    def tick(self):
+        self.call("tick")
+
+    def next_quarter(self):
+        return self.call("next_quarter")
+
+    def adjust_all(self, seconds):
+        self.call("adjust_all", seconds)
+
+    def add_penalty(self, index, seconds=0):
+        self.call("add_penalty", index, seconds)
+
+    def remove_penalty(self, index):
+        self.call("remove_penalty", index)
+
+    def clear_penalties(self):
+        self.call("clear_penalties")
+
+    def set_penalty(self, index, seconds):
+        self.call("set_penalty", index, seconds)
+
+    def start_penalty(self, index):
+        self.call("start_penalty", index)
+
+    def stop_penalty(self, index):
+        self.call("stop_penalty", index)
+
+    def start_all_penalties(self):
+        self.call("start_all_penalties")
+
+    def stop_all_penalties(self):
+        self.call("stop_all_penalties")
+
+    def release(self, index):
+        self.call("release", index)
+
+
+def main():
+    """Show that the engine process keeps time while this process is stuck"""
+    engine = SharedEngine(12 * 60)
+    engine.add_penalty(1, 5)
+    engine.start()
+    engine.start_penalty(1)
+    expired = []
+    engine.subscribe(lambda event, data: expired.append((event, data)))
+
+    time.sleep(6.5)  # a frozen UI, nothing calls the engine
+    header = engine.state.read()
+    print(f"engine last settled {time.monotonic() - header[4]:.3f}s ago, {engine.remaining():.2f}s left on the clock, "
+          f"penalty 1 has {engine.penalty_remaining(1):.2f}s left")
+    engine.tick()
+    print(f"events collected on the next tick: {expired}")
+    engine.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+
+
+def empty_state():
+    """A game state with no timers, in the same shape as the saved JSON file"""
+    return {
+        "quarter": 1,
+        "quarter_length": 12 * 60,
+        "game_clock_time": 12 * 60,
+        "show_tenths": False,
+        "timers": {}
+    }
+
+
+def apply_record(state, record):
+    """Apply one journal record to a state dict
+
+    Every record sets values rather than changing them by an amount, so a
+    record replayed twice after a crash lands on the same state.
+    """
+    op = record["op"]
+    timers = state["timers"]
+    if op == "game":
+        for key, value in record.items():
+            if key != "op":
+                state[key] = value
+    elif op == "timer":
+        timer = timers.setdefault(str(record["index"]), {})
+        for key, value in record.items():
+            if key not in ("op", "index"):
+                timer[key] = value
+    elif op == "times":
+        if "game_clock_time" in record:
+            state["game_clock_time"] = record["game_clock_time"]
+        for index, paused_time in record.get("timers", {}).items():
+            if index in timers:
+                timers[index]["paused_time"] = paused_time
+    elif op == "remove":
+        timers.pop(str(record["index"]), None)
+    elif op == "clear":
+        timers.clear()
+    return state
+
+
+# binary snapshot layout, all little endian:
+#   header   magic, version, timer count, string count, quarter, quarter length,
+#            game clock, generation, archive game id (-1 for none), show tenths
+#   timers   fixed width records, text fields are ids into the string table
+#   strings  length prefixed UTF-8, each distinct team or penalty name stored once
+SNAPSHOT_MAGIC = b"LAXS"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<4sHIIiidIq?")
+SNAPSHOT_TIMER = struct.Struct("<I5Idq")
+SNAPSHOT_STRING = struct.Struct("<H")
+TIMER_TEXT_FIELDS = ("player_number", "team_name", "penalty_type", "penalty_time", "time_option")
+
+
+def pack_snapshot(state):
+    """Encode a state dict as a binary snapshot"""
+    strings = {}  # text -> id in the string table
+    
+    def intern(text):
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+    
+    records = []
+    for index, timer in state["timers"].items():
+        archive_id = timer.get("archive_id")
+        records.append(SNAPSHOT_TIMER.pack(
+            int(index),
+            *(intern(timer.get(key, "")) for key in TIMER_TEXT_FIELDS),
+            timer.get("paused_time", 0),
+            -1 if archive_id is None else archive_id
+        ))
+    
+    archive_game_id = state.get("archive_game_id")
+    header = SNAPSHOT_HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(records), len(strings),
+        state["quarter"], state["quarter_length"], state["game_clock_time"],
+        state.get("generation", 0), -1 if archive_game_id is None else archive_game_id,
+        state.get("show_tenths", False)
+    )
+    table = []
+    for text in strings:
+        encoded = text.encode("utf-8")
+        table.append(SNAPSHOT_STRING.pack(len(encoded)) + encoded)
+    return b"".join([header, *records, *table])
+
+
+def unpack_snapshot(buffer):
+    """Decode a binary snapshot from bytes or a mmap"""
+    (magic, version, timer_count, string_count, quarter, quarter_length, game_clock_time,
+     generation, archive_game_id, show_tenths) = SNAPSHOT_HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not a lacrosse timer snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+    
+    # the string table follows the fixed width records
+    view = memoryview(buffer)
+    offset = SNAPSHOT_HEADER.size + timer_count * SNAPSHOT_TIMER.size
+    strings = []
+    for _ in range(string_count):
+        (length,) = SNAPSHOT_STRING.unpack_from(buffer, offset)
+        offset += SNAPSHOT_STRING.size
+        strings.append(str(view[offset:offset + length], "utf-8"))
+        offset += length
+    
+    timers = {}
+    records = view[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + timer_count * SNAPSHOT_TIMER.size]
+    for index, *text_ids, paused_time, archive_id in SNAPSHOT_TIMER.iter_unpack(records):
+        timer = {key: strings[text_id] for key, text_id in zip(TIMER_TEXT_FIELDS, text_ids)}
+        timer["paused_time"] = paused_time
+        timer["archive_id"] = None if archive_id < 0 else archive_id
+        timers[str(index)] = timer
+    records.release()
+    view.release()
+    
+    return {
+        "quarter": quarter,
+        "quarter_length": quarter_length,
+        "game_clock_time": game_clock_time,
+        "show_tenths": show_tenths,
+        "archive_game_id": None if archive_game_id < 0 else archive_game_id,
+        "generation": generation,
+        "binary_snapshot": True,
+        "timers": timers
+    }
+
+
+def read_snapshot(path):
+    """Read a binary snapshot or a legacy JSON one, whichever the file holds"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{path} is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if buffer[:len(SNAPSHOT_MAGIC)] == SNAPSHOT_MAGIC:
+                return unpack_snapshot(buffer)
+            return json.loads(buffer[:].decode("utf-8"))
+
+
+def write_atomic(path, payload):
+    """Write bytes to a temp file and rename it over path, so path is never half written"""
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    
+    # make the rename itself durable where the platform allows it
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class SnapshotWriter:
+    """Background thread that writes state snapshots, coalescing bursts into one write
+
+    submit() only hands over a state dict the caller no longer touches, so
+    the UI thread never waits on the disk. The writer waits until saves
+    have been quiet for `delay` seconds (or pending for `max_delay`) and
+    passes only the newest state for each `write` callable, so one thread
+    can serve the journals of several games.
+    """
+
+    def __init__(self, delay=0.3, max_delay=2.0):
+        self.delay = delay
+        self.max_delay = max_delay
+        self.condition = threading.Condition()
+        self.pending = {}  # write callable -> (newest state, after_write) waiting to be written
+        self.first_submit = None  # when the oldest unwritten save arrived
+        self.last_submit = None
+        self.writing = False
+        self.closing = False
+        self.written = 0  # snapshots written
+        self.submitted = 0  # snapshots handed over, including coalesced ones
+        self.error = None  # last write failure, cleared by the next success
+        self.last_written = None  # wall clock time of the last successful write
+        self.thread = threading.Thread(target=self.run, name="snapshot-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, state, write, after_write=None):
+        """Queue a state for write(), replacing any state for it not yet written
+
+        after_write(state) runs on the writer thread once the state is on disk.
+        """
+        with self.condition:
+            now = time.monotonic()
+            if not self.pending:
+                self.first_submit = now
+            self.pending[write] = (state, after_write)
+            self.last_submit = now
+            self.submitted += 1
+            self.condition.notify()
+
+    def discard(self, write):
+        """Drop a queued state that should no longer reach the disk"""
+        with self.condition:
+            self.pending.pop(write, None)
+            # a write already under way finishes before the caller goes on
+            while self.writing:
+                self.condition.wait()
+
+    def busy(self):
+        """Whether a snapshot is queued or being written"""
+        with self.condition:
+            return bool(self.pending) or self.writing
+
+    def run(self):
+        """Writer thread loop"""
+        while True:
+            with self.condition:
+                while True:
+                    if self.pending:
+                        now = time.monotonic()
+                        wait = min(self.last_submit + self.delay, self.first_submit + self.max_delay) - now
+                        if wait <= 0 or self.closing:
+                            break
+                        self.condition.wait(wait)
+                    elif self.closing:
+                        return
+                    else:
+                        self.condition.wait()
+                batch = self.pending
+                self.pending = {}
+                self.writing = True
+            
+            error = None
+            written = 0
+            for write, (state, after_write) in batch.items():
+                try:
+                    write(state)
+                    if after_write is not None:
+                        after_write(state)
+                    written += 1
+                except Exception as e:
+                    error = e
+            
+            with self.condition:
+                self.writing = False
+                self.error = error
+                self.written += written
+                if written:
+                    self.last_written = time.time()
+                self.condition.notify_all()
+
+    def close(self, timeout=5.0):
+        """Write anything still queued and stop the thread"""
+        with self.condition:
+            self.closing = True
+            self.condition.notify()
+        self.thread.join(timeout)
+
+
+class GameJournal:
+    """Append-only journal of game actions on top of a JSON snapshot
+
+    Each action is one JSON line appended to the current journal segment.
+    Lines are handed to the OS straight away and fsynced in batches, so a
+    crash loses at most the last unsynced batch. compact() starts a new
+    segment and hands the full state to the background snapshot writer;
+    segments are deleted only once a snapshot covering them is on disk.
+    The snapshot records its generation, and load() replays just the
+    segments written after it.
+
+    With `binary` set the snapshot is written in the compact binary format
+    instead of JSON; load() reads whichever of the two is newer.
+    """
+
+    def __init__(self, snapshot_path="lacrosse_timer_data.json", journal_path="lacrosse_timer_data.journal",
+                 binary_path="lacrosse_timer_data.lax", binary=False, writer=None,
+                 sync_every=32, sync_interval=2.0, compact_every=500):
+        self.snapshot_path = snapshot_path
+        self.binary_path = binary_path
+        self.binary = binary
+        self.journal_path = journal_path
+        self.sync_every = sync_every  # records per fsync
+        self.sync_interval = sync_interval  # max seconds a record waits for fsync
+        self.compact_every = compact_every  # records before the journal should be compacted
+        self.file = None
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.records = 0  # records since the last compaction
+        self.generation = 0  # snapshot generation the current segment follows
+        self.owns_writer = writer is None  # a shared writer is closed by whoever made it
+        self.writer = SnapshotWriter() if writer is None else writer
+
+    def segment_path(self, generation):
+        """Journal file holding the records written after snapshot `generation`"""
+        if generation == 0:
+            return self.journal_path
+        return f"{self.journal_path}.{generation}"
+
+    def segments(self):
+        """Generations of the journal segments on disk, oldest first"""
+        folder = os.path.dirname(os.path.abspath(self.journal_path))
+        name = os.path.basename(self.journal_path)
+        found = []
+        for entry in os.listdir(folder):
+            if entry == name:
+                found.append(0)
+            elif entry.startswith(name + ".") and entry[len(name) + 1:].isdigit():
+                found.append(int(entry[len(name) + 1:]))
+        return sorted(found)
+
+    def open(self):
+        """Open the current segment for appending"""
+        if self.file is None:
+            self.file = open(self.segment_path(self.generation), "a", encoding="utf-8")
+
+    def append(self, record):
+        """Write one record, syncing to disk when the batch is full or old enough"""
+        self.open()
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.file.flush()
+        self.unsynced += 1
+        self.records += 1
+        self.maybe_sync()
+
+    def maybe_sync(self):
+        """fsync the pending batch if it is full or has waited long enough"""
+        if self.unsynced and (self.unsynced >= self.sync_every
+                              or time.monotonic() - self.last_sync >= self.sync_interval):
+            self.sync()
+
+    def sync(self):
+        """Force every written record to disk"""
+        if self.file is not None and self.unsynced:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def needs_compaction(self):
+        """Whether the journal has grown enough to fold into a snapshot"""
+        return self.records >= self.compact_every
+
+    def compact(self, state):
+        """Start a new segment and queue state as the snapshot that covers the old ones"""
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+        self.generation += 1
+        self.records = 0
+        state["generation"] = self.generation
+        state["binary_snapshot"] = self.binary
+        self.writer.submit(state, self.write_snapshot, self.drop_segments)
+    
+    def write_snapshot(self, state):
+        """Write state in the chosen format and remove the snapshot in the other one"""
+        if state["binary_snapshot"]:
+            write_atomic(self.binary_path, pack_snapshot(state))
+            stale_path = self.snapshot_path
+        else:
+            write_atomic(self.snapshot_path, json.dumps(state).encode("utf-8"))
+            stale_path = self.binary_path
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+
+    def drop_segments(self, state):
+        """Delete the segments a freshly written snapshot already covers"""
+        for generation in self.segments():
+            if generation < state["generation"]:
+                os.remove(self.segment_path(generation))
+
+    def load(self):
+        """Rebuild the state from the snapshot and journal, or None if neither exists"""
+        state = None
+        for path in (self.snapshot_path, self.binary_path):
+            if os.path.exists(path):
+                found = read_snapshot(path)
+                # both exist only if a crash came between writing one and removing the other
+                if state is None or found.get("generation", 0) > state.get("generation", 0):
+                    state = found
+        if state is not None:
+            self.binary = state.get("binary_snapshot", False)
+        base = state.get("generation", 0) if state is not None else 0
+        
+        for generation in self.segments():
+            self.generation = max(self.generation, generation)
+            if generation < base:
+                continue  # left over from before the snapshot was written
+            with open(self.segment_path(generation), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # a torn last line from a crash mid-write
+                    if state is None:
+                        state = empty_state()
+                    apply_record(state, record)
+                    self.records += 1
+        self.generation = max(self.generation, base)
+        return state
+
+    def close(self):
+        """Sync and close the journal, waiting for the last snapshot to be written"""
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+        if self.owns_writer:
+            self.writer.close()
+
+    def delete(self):
+        """Close the journal and remove its snapshot and segments from disk"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.writer.discard(self.write_snapshot)
+        for generation in self.segments():
+            os.remove(self.segment_path(generation))
+        for path in (self.snapshot_path, self.binary_path):
+            if os.path.exists(path):
+                os.remove(path)
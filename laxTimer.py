@@ -1,35 +1,533 @@
+import time
+IMPORT_STARTED = time.perf_counter()
+
+import argparse
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import json
-import os
+import glob
+import math
+import re
+import sqlite3
+from collections import deque
 from datetime import datetime
-from docx import Document
+from laxEngine import GameClockEngine
+from laxModel import TimerStore
+from laxMetrics import TickMetrics
+from laxStore import GameJournal, SnapshotWriter
+from laxArchive import GameArchive
+from laxExport import ReportBuilder, WRITERS
 
-class LacrosseTimerApp:
+class RenderLayer:
+    """Remembers what every display element shows and applies only real changes, once per frame"""
+    
+    missing = object()
+    
     def __init__(self, root):
+        self.root = root
+        self.shown = {}  # (widget, canvas item or None, option) -> value on screen
+        self.pending = {}  # same keys -> value waiting for the next flush
+        self.flush_after_id = None
+        self.applied = 0
+        self.skipped = 0
+    
+    def set(self, widget, option, value):
+        """Stage a widget option, e.g. a label's text"""
+        self.stage((widget, None, option), value)
+    
+    def set_item(self, canvas, item, option, value):
+        """Stage an option on a canvas item"""
+        self.stage((canvas, item, option), value)
+    
+    def stage(self, key, value):
+        """Queue a change unless the element already shows (or is about to show) the value"""
+        if self.pending.get(key, self.shown.get(key, self.missing)) == value:
+            self.skipped += 1
+            return
+        self.pending[key] = value
+        if self.flush_after_id is None:
+            self.flush_after_id = self.root.after_idle(self.flush)
+    
+    def flush(self):
+        """Apply every staged change in one batch"""
+        if self.flush_after_id is not None:
+            self.root.after_cancel(self.flush_after_id)
+            self.flush_after_id = None
+        
+        pending, self.pending = self.pending, {}
+        for key, value in pending.items():
+            # a value set and then set back before the flush costs nothing
+            if self.shown.get(key, self.missing) == value:
+                self.skipped += 1
+                continue
+            self.shown[key] = value
+            widget, item, option = key
+            if item is None:
+                widget.configure(**{option: value})
+            else:
+                widget.itemconfigure(item, **{option: value})
+            self.applied += 1
+    
+    def forget(self, widget):
+        """Drop everything cached for a widget whose items are being recreated"""
+        for cache in (self.shown, self.pending):
+            for key in [key for key in cache if key[0] is widget]:
+                del cache[key]
+    
+    def stats(self):
+        """How many updates were applied and how many were skipped as redundant"""
+        return {"applied": self.applied, "skipped": self.skipped}
+
+class RowPool:
+    """Recycles timer row widgets instead of destroying and rebuilding them"""
+    
+    def __init__(self, build, reset):
+        self.build = build  # makes a new row
+        self.reset = reset  # returns a row to its blank, hidden state
+        self.idle = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.in_use = 0
+    
+    def prefill(self, count):
+        """Build rows ahead of time until count exist"""
+        while self.created < count:
+            self.idle.append(self.build())
+            self.created += 1
+    
+    def acquire(self):
+        """Hand out an idle row, building one only if the pool is empty"""
+        if self.idle:
+            row = self.idle.pop()
+            self.reused += 1
+        else:
+            row = self.build()
+            self.created += 1
+        self.in_use += 1
+        return row
+    
+    def release(self, row):
+        """Take a row back for reuse"""
+        self.reset(row)
+        self.idle.append(row)
+        self.in_use -= 1
+        self.released += 1
+    
+    def stats(self):
+        """Pool size and reuse counters"""
+        return {
+            "created": self.created,
+            "in_use": self.in_use,
+            "idle": len(self.idle),
+            "reused": self.reused,
+            "released": self.released
+        }
+
+class Animator:
+    """Drives every timed effect, row flashes and notice timeouts, from one after() chain
+
+    Effects are callables taking the current time and returning whether
+    they still have frames to draw. They all run in the same frame, so
+    penalties that expire together blink in step and reach the screen in
+    one render pass instead of each keeping its own timer.
+    """
+    
+    frame = 0.25  # seconds between frames while anything is animating
+    
+    def __init__(self, root, clock=time.monotonic):
+        self.root = root
+        self.clock = clock
+        self.effects = {}  # name -> effect(now), True while it has frames left
+        self.after_id = None
+        self.frames = 0
+    
+    def start(self, name, effect):
+        """Run an effect from the next frame on, replacing any effect of the same name"""
+        self.effects[name] = effect
+        if self.after_id is None:
+            self.after_id = self.root.after_idle(self.run)
+    
+    def run(self):
+        """Draw one frame of every effect and drop the ones that have finished"""
+        self.after_id = None
+        self.frames += 1
+        now = self.clock()
+        for name, effect in list(self.effects.items()):
+            # an effect may replace itself while it runs, only the finished one is dropped
+            if not effect(now) and self.effects.get(name) is effect:
+                del self.effects[name]
+        if self.effects and self.after_id is None:
+            self.after_id = self.root.after(int(self.frame * 1000), self.run)
+
+class NoticeBar:
+    """In-window toasts that queue up instead of blocking the event loop like a message box"""
+    
+    colors = {"info": "#333333", "warning": "#B35C00", "error": "#B00020"}
+    
+    def __init__(self, app):
+        self.app = app
+        self.queue = deque()  # notices waiting for the bar
+        self.current = None  # notice on show
+        
+        self.frame = tk.Frame(app.root, bg=self.colors["info"], padx=12, pady=6)
+        self.label = tk.Label(
+            self.frame,
+            text="",
+            font=("Arial", 13, "bold"),
+            bg=self.colors["info"],
+            fg="white",
+            wraplength=900,
+            justify=tk.LEFT
+        )
+        self.label.pack(side=tk.LEFT)
+        self.dismiss_btn = tk.Button(
+            self.frame,
+            text="✕",
+            command=self.advance,
+            font=("Arial", 12),
+            bg=self.colors["info"],
+            fg="white",
+            bd=0
+        )
+        self.dismiss_btn.pack(side=tk.RIGHT, padx=(10, 0))
+        self.action_btn = tk.Button(self.frame, command=self.act, font=("Arial", 12), bd=0)
+    
+    def post(self, text, kind="info", seconds=4.0, group=None, action=None):
+        """Queue a notice, kept up until dismissed if seconds is None; one in the same group as a notice waiting or on show joins it"""
+        for notice in ([self.current] if self.current else []) + list(self.queue):
+            if group is not None and notice["group"] == group:
+                if text not in notice["texts"]:
+                    notice["texts"].append(text)
+                if notice is self.current:
+                    self.show()
+                return
+            if notice["texts"] == [text]:
+                return  # already waiting or on show
+        self.queue.append({"texts": [text], "kind": kind, "seconds": seconds, "group": group, "action": action})
+        if self.current is None:
+            self.advance()
+    
+    def advance(self):
+        """Show the next queued notice, or hide the bar when none is left"""
+        self.current = self.queue.popleft() if self.queue else None
+        if self.current is None:
+            self.frame.place_forget()
+            return
+        self.show()
+        # hangs just under the game clock, which must never be covered
+        self.frame.place(in_=self.app.game_clock_frame, relx=0.5, rely=1.0, y=6, anchor="n")
+        self.frame.lift()
+    
+    def show(self):
+        """Draw the current notice and restart its timeout"""
+        notice = self.current
+        if notice["seconds"] is not None:
+            notice["ends"] = self.app.animator.clock() + notice["seconds"]
+            self.app.animator.start("notice", self.animate)
+        
+        view = self.app.view
+        color = self.colors[notice["kind"]]
+        for widget in (self.frame, self.label, self.dismiss_btn):
+            view.set(widget, "bg", color)
+        view.set(self.label, "text", "   •   ".join(notice["texts"]))
+        if notice["action"] is not None:
+            view.set(self.action_btn, "text", notice["action"][0])
+            self.action_btn.pack(side=tk.RIGHT, padx=(10, 0))
+        else:
+            self.action_btn.pack_forget()
+    
+    def animate(self, now):
+        """Take the notice down once its time is up, running while a timed notice is on show"""
+        notice = self.current
+        if notice is None or notice["seconds"] is None:
+            return False
+        if now >= notice["ends"]:
+            self.advance()
+            return self.current is not None and self.current["seconds"] is not None
+        return True
+    
+    def act(self):
+        """Run the current notice's action and move on"""
+        callback = self.current["action"][1]
+        self.advance()
+        callback()
+
+class DebugOverlay:
+    """Tick timing, clock drift and render counts over the corner of the window, toggled with F12"""
+    
+    def __init__(self, app):
+        self.app = app
+        self.visible = False
+        self.label = tk.Label(
+            app.root,
+            text="",
+            font=("Courier", 10),
+            bg="black",
+            fg="#00FF66",
+            justify=tk.LEFT,
+            padx=8,
+            pady=6
+        )
+    
+    def toggle(self, event=None):
+        """Show or hide the overlay"""
+        self.visible = not self.visible
+        if self.visible:
+            self.label.place(x=10, rely=1.0, y=-60, anchor="sw")
+            self.label.lift()
+            self.app.animator.start("overlay", self.refresh)
+        else:
+            self.label.place_forget()
+        return "break"
+    
+    def refresh(self, now):
+        """Redraw the overlay, True while it is shown"""
+        if not self.visible:
+            return False
+        app = self.app
+        lines = app.metrics.summary()
+        lines.append(f"render     {app.view.applied} applied, {app.view.skipped} skipped, {app.animator.frames} animation frames")
+        if app.scoreboard is not None:
+            lines.append(f"scoreboard {app.scoreboard.clients()} displays")
+        app.view.set(self.label, "text", "\n".join(lines))
+        return True
+
+class SpectatorBoard:
+    """Render-only board for spectators, drawn as text items on a single canvas"""
+    
+    def __init__(self, app):
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Lacrosse Scoreboard")
+        self.window.configure(bg="black")
+        self.window.geometry("800x600")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        
+        self.canvas = tk.Canvas(self.window, bg="black", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.bind("<Configure>", self.schedule_layout)
+        
+        self.items = {}  # key -> canvas text item
+        self.penalty_slots = 0
+        self.size = (800, 600)
+        self.layout_after_id = None
+        self.layout()
+    
+    def schedule_layout(self, event):
+        """Coalesce a burst of resize events into one layout when the event loop goes idle"""
+        self.size = (event.width, event.height)
+        if self.layout_after_id is None:
+            self.layout_after_id = self.window.after_idle(self.layout)
+    
+    def layout(self):
+        """Create the text items sized to the canvas, then draw the current state"""
+        self.layout_after_id = None
+        width, height = self.size
+        self.app.view.forget(self.canvas)
+        self.canvas.delete("all")
+        self.items = {}
+        
+        self.add_item("quarter", width // 2, height * 0.06, ("Arial", max(12, height // 25), "bold"), "white")
+        self.add_item("clock", width // 2, height * 0.2, ("Arial", max(24, height // 7), "bold"), "#FFD966")
+        self.add_item("heading", width // 2, height * 0.36, ("Arial", max(12, height // 28), "bold"), "white")
+        self.set("heading", "PENALTIES")
+        
+        # one line per penalty, as many as fit below the heading
+        line_height = max(24, height // 16)
+        top = height * 0.36 + line_height
+        self.penalty_slots = max(0, int((height - top) // line_height))
+        font = ("Arial", max(12, line_height * 2 // 3), "bold")
+        for slot in range(self.penalty_slots):
+            y = top + slot * line_height
+            self.add_item(("player", slot), width * 0.08, y, font, "white", "w")
+            self.add_item(("team", slot), width * 0.35, y, font, "white", "w")
+            self.add_item(("time", slot), width * 0.92, y, font, "#FF7070", "e")
+        
+        self.render()
+    
+    def add_item(self, key, x, y, font, color, anchor="center"):
+        """Create an empty text item for key"""
+        self.items[key] = self.canvas.create_text(x, y, text="", font=font, fill=color, anchor=anchor)
+    
+    def set(self, key, text):
+        """Stage an item's text with the app's render layer"""
+        self.app.view.set_item(self.canvas, self.items[key], "text", text)
+    
+    def render(self):
+        """Draw the game clock and the penalties still being served, next out first"""
+        app = self.app
+        engine = app.engine
+        self.set("quarter", f"QUARTER {engine.quarter}/4")
+        self.set("clock", app.format_game_clock(engine.game_clock_time))
+        
+        serving = []
+        for index in app.timer_order:
+            remaining = engine.penalty_remaining(index)
+            if remaining > 0:
+                serving.append((remaining, index))
+        serving.sort()
+        
+        for slot in range(self.penalty_slots):
+            if slot < len(serving):
+                remaining, index = serving[slot]
+                timer_data = app.timer_data[index]
+                self.set(("player", slot), f"#{timer_data['player_number']}" if timer_data["player_number"] else f"Timer {index}")
+                self.set(("team", slot), timer_data["team_name"])
+                self.set(("time", slot), app.seconds_to_ms(remaining))
+            else:
+                self.set(("player", slot), "")
+                self.set(("team", slot), "")
+                self.set(("time", slot), "")
+    
+    def close(self):
+        """Close the board window"""
+        self.app.board = None
+        if self.layout_after_id is not None:
+            self.window.after_cancel(self.layout_after_id)
+        self.app.view.forget(self.canvas)  # drop its cached text before the items go away
+        self.window.destroy()
+
+class StartupTimer:
+    """Wall time spent in each phase of startup"""
+    
+    def __init__(self, started=None):
+        self.last = time.perf_counter() if started is None else started
+        self.started = self.last
+        self.phases = []  # (name, seconds) in order
+    
+    def mark(self, name):
+        """End the current phase under the given name"""
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+    
+    def report(self):
+        """Print the breakdown and time to first clock"""
+        for name, seconds in self.phases:
+            print(f"{name:<24} {seconds * 1000:8.1f} ms")
+        print(f"{'total':<24} {(self.last - self.started) * 1000:8.1f} ms")
+
+class GameSession:
+    """One game on one field: its clock, timers, journal and report
+
+    The app shows one session at a time and shares everything else
+    between them, the widgets, the master tick, the snapshot writer
+    thread and the archive, so each extra field only costs its model.
+    """
+    
+    def __init__(self, number, quarter_length, writer, engine_process=False):
+        self.number = number
+        self.name = f"Field {number}"
+        # the clock can run in its own process, where nothing on the Tk thread can hold it up
+        self.engine_process = engine_process
+        if engine_process:
+            from laxShared import SharedEngine  # shared memory and multiprocessing only load when asked for
+            self.engine = SharedEngine(quarter_length)
+        else:
+            self.engine = GameClockEngine(quarter_length)
+        self.timer_data = TimerStore()  # timer index -> the fields shown on its row, as immutable snapshots
+        self.flashing = {}  # timer index -> time its completion flash ends
+        self.show_tenths = False  # 10 Hz display in the final minute
+        self.archive_game_id = None  # this game's row in the archive
+        self.report = ReportBuilder()  # Word report, built on a worker thread as penalties happen
+        self.tab = None  # tab button in the header
+        
+        # field 1 keeps the original file names so existing saves still load
+        base = "lacrosse_timer_data" if number == 1 else f"lacrosse_timer_data_field{number}"
+        self.journal = GameJournal(f"{base}.json", f"{base}.journal", f"{base}.lax", writer=writer)
+    
+    @staticmethod
+    def saved_numbers():
+        """Numbers of the extra fields that have a saved game on disk"""
+        numbers = set()
+        for path in glob.glob("lacrosse_timer_data_field*"):
+            match = re.match(r"lacrosse_timer_data_field(\d+)\.", path)
+            if match:
+                numbers.add(int(match.group(1)))
+        return sorted(numbers)
+    
+    @property
+    def timer_order(self):
+        """Timer indexes in display order"""
+        return self.timer_data.order
+    
+    def close(self):
+        """Stop the engine process, if the clock runs in one"""
+        if self.engine_process:
+            self.engine.close()
+
+def session_attribute(name):
+    """App attribute that reads and writes the same attribute of the current game session"""
+    return property(
+        lambda self: getattr(self.session, name),
+        lambda self, value: setattr(self.session, name, value)
+    )
+
+class LacrosseTimerApp:
+    # per game state lives on the session being acted on, normally the one on screen
+    engine = session_attribute("engine")
+    timer_data = session_attribute("timer_data")
+    timer_order = session_attribute("timer_order")
+    flashing = session_attribute("flashing")
+    show_tenths = session_attribute("show_tenths")
+    archive_game_id = session_attribute("archive_game_id")
+    report = session_attribute("report")
+    journal = session_attribute("journal")
+    
+    def __init__(self, root, startup=None, scoreboard=None, engine_process=False):
         self.root = root
         self.root.withdraw()  # hide the main window off the bat
+        self.startup = startup if startup is not None else StartupTimer()
+        self.scoreboard = scoreboard  # live scoreboard server for displays on the network, if any
         
-        # show quarter length selection dialog first
-        self.select_quarter_length()
+        self.engine_process = engine_process  # run each field's clock in a separate process
+        
+        # one snapshot writer thread serves every field's journal
+        self.snapshot_writer = SnapshotWriter()
+        self.sessions = []  # every game in progress, one per field
+        
+        # read the saved game first, a restored game doesn't need the quarter length dialog
+        first = GameSession(1, 12 * 60, self.snapshot_writer, self.engine_process)
+        self.session = self.shown = first
+        saved = self.read_saved_state()
+        self.startup.mark("state read")
+        
+        if saved is None:
+            # show quarter length selection dialog first
+            self.select_quarter_length()
+            self.startup.mark("quarter length dialog")
+        else:
+            self.quarter_length = saved.get("quarter_length", 12 * 60)
         
         self.root.title("Lacrosse Timer App - © Dan Finn")
         self.root.configure(bg="#e6f2ff")  # for light blue background
         self.root.geometry("1200x800")
         
-        # game clock variables
-        self.quarter = 1
-        # quarter_length is now set by select_quarter_length()
-        self.game_clock_running = False
-        self.game_clock_time = self.quarter_length
-        self.game_paused_between_quarters = False
-        
-        # variables to track timers
-        self.intervals = {}  # store timer objects
-        self.paused_times = {}  # store paused times in seconds
-        self.timer_frames = {}  # store timer frames
+        # game clock and penalty timing lives in each session's engine, the UI just draws it
+        # quarter_length is set by select_quarter_length()
+        first.engine.new_game(self.quarter_length)
+        self.add_session(first)
+        
+        # master tick scheduler, one callback chain drives every field's clock
+        self.tick_after_id = None
+        self.view = RenderLayer(self.root)  # every display update goes through here
+        self.animator = Animator(self.root)  # row flashes and notice timeouts
+        self.metrics = TickMetrics()  # tick lateness, tick duration and clock drift
+        self.flash_started = 0.0  # flashes running together blink in step from here
         self.timer_count = 2  # start with 2 timers by default
-        self.timer_running_states = {}  # track which timers were running when quarter ended
+        
+        # virtualized timer list, only rows inside the viewport have widgets
+        self.row_pool = RowPool(self.create_timer_row, self.reset_timer_row)
+        self.timer_rows = []  # rows taken from the pool, in viewport order
+        self.visible_rows = {}  # timer index -> row currently showing it
+        self.row_height = 290  # measured from the first row that is built
+        self.scroll_height = None  # last scrollregion height set on the canvas
+        self.row_width = 1  # width applied to every row window
+        self.layout_after_id = None  # pending idle layout pass
+        self.board = None  # spectator board window, when open
+        self.save_poll_id = None  # pending check on the background snapshot writer
+        self.archive = GameArchive()  # every game and penalty, kept for season queries
+        self.export_poll_id = None  # pending check on running exports
         
         # create main frame with scrollbar
         self.main_frame = tk.Frame(root, bg="#e6f2ff")
@@ -41,15 +539,11 @@ class LacrosseTimerApp:
         # create canvas with scrollbar
         self.canvas = tk.Canvas(self.main_frame, bg="#e6f2ff")
         self.scrollbar = ttk.Scrollbar(self.main_frame, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self.on_canvas_scroll)
         
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # create a frame inside the canvas for the timers
-        self.timer_container = tk.Frame(self.canvas, bg="#e6f2ff")
-        self.canvas.create_window((0, 0), window=self.timer_container, anchor="nw")
-        
         # header
         self.header = tk.Frame(root, bg="#007BFF", height=50)
         self.header.pack(fill=tk.X, side=tk.TOP)
@@ -64,6 +558,30 @@ class LacrosseTimerApp:
         )
         self.title_label.pack(pady=10, side=tk.LEFT, padx=10)
         
+        # one tab per field, plus buttons to open and close fields
+        self.tab_bar = tk.Frame(self.header, bg="#007BFF")
+        self.tab_bar.pack(side=tk.LEFT, padx=10)
+        self.add_field_btn = tk.Button(
+            self.tab_bar,
+            text="+ Field",
+            command=self.add_field,
+            font=("Arial", 11),
+            bg="#007BFF",
+            fg="white",
+            bd=0
+        )
+        self.add_field_btn.pack(side=tk.RIGHT, padx=5)
+        self.close_field_btn = tk.Button(
+            self.tab_bar,
+            text="✕ Field",
+            command=self.close_field,
+            font=("Arial", 11),
+            bg="#007BFF",
+            fg="white",
+            bd=0
+        )
+        self.close_field_btn.pack(side=tk.RIGHT, padx=5)
+        
         # exit button in top right
         self.exit_btn = tk.Button(
             self.header,
@@ -78,6 +596,20 @@ class LacrosseTimerApp:
         )
         self.exit_btn.pack(side=tk.RIGHT, padx=10)
         
+        # spectator board button
+        self.board_btn = tk.Button(
+            self.header,
+            text="📺 Board",
+            command=self.toggle_board,
+            font=("Arial", 12),
+            bg="#007BFF",
+            fg="white",
+            bd=0,
+            padx=10,
+            pady=5
+        )
+        self.board_btn.pack(side=tk.RIGHT, padx=10)
+        
         # settings button
         self.settings_btn = tk.Button(
             self.header,
@@ -92,6 +624,22 @@ class LacrosseTimerApp:
         )
         self.settings_btn.pack(side=tk.RIGHT, padx=10)
         
+        # save status, updated while the snapshot writer works in the background
+        self.save_status_label = tk.Label(
+            self.header,
+            text="",
+            font=("Arial", 11),
+            bg="#007BFF",
+            fg="white"
+        )
+        self.save_status_label.pack(side=tk.RIGHT, padx=10)
+        
+        # toasts for quarter ends, served penalties and save problems, never a blocking dialog
+        self.notices = NoticeBar(self)
+        self.overlay = DebugOverlay(self)
+        if self.scoreboard is not None:
+            self.scoreboard.metrics = self.metrics_text
+        
         # footer with control buttons
         self.footer = tk.Frame(root, bg="#007BFF", height=50)
         self.footer.pack(fill=tk.X, side=tk.BOTTOM)
@@ -165,15 +713,18 @@ class LacrosseTimerApp:
         )
         self.save_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=5, pady=10)
         
-        # initialize timers
-        self.initialize_timers()
+        self.startup.mark("ui build")
         
-        # load saved data if exists
-        self.load_data()
+        # build the saved timers, or the defaults when there is nothing saved, exactly once
+        self.restore_state(saved)
         
-        # configure canvas scrolling
-        self.timer_container.bind("<Configure>", self.on_frame_configure)
-        self.canvas.bind("<Configure>", self.on_canvas_configure)
+        # games left running on other fields come back too
+        for number in GameSession.saved_numbers():
+            session = GameSession(number, 12 * 60, self.snapshot_writer, self.engine_process)
+            self.run_in(session, self.restore_session)
+        self.render_tabs()
+        self.report_lost_engines()
+        self.startup.mark("state restore")
         
         # bind mousewheel for scrolling
         self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
@@ -182,12 +733,16 @@ class LacrosseTimerApp:
         self.root.bind("<F11>", self.toggle_fullscreen)
         self.root.bind("<Escape>", self.end_fullscreen)
         
+        # debug overlay with tick timing, and a dump of the same metrics for after the game
+        self.root.bind("<F12>", self.overlay.toggle)
+        self.root.bind("<Shift-F12>", self.dump_metrics)
+        
         # set up window size constraints
         self.root.update()
         self.root.minsize(800, 600)
         
-        # adjust timer window sizes for fullscreen
-        self.root.bind("<Configure>", self.adjust_timer_sizes)
+        # resizes of the window or the timer canvas are coalesced into one layout pass
+        self.root.bind("<Configure>", self.schedule_layout)
         
         # show the main window now that everything is set up
         self.root.deiconify()
@@ -250,6 +805,7 @@ class LacrosseTimerApp:
     
     def seconds_to_ms(self, seconds):
         """Convert seconds to MM:SS format"""
+        seconds = int(math.ceil(seconds))
         minutes = seconds // 60
         secs = seconds % 60
         return f"{minutes:02d}:{secs:02d}"
@@ -264,11 +820,27 @@ class LacrosseTimerApp:
     
     def seconds_to_hms(self, seconds):
         """Convert seconds to HH:MM:SS format"""
+        seconds = int(math.ceil(seconds))
         hours = seconds // 3600
         minutes = (seconds % 3600) // 60
         secs = seconds % 60
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     
+    def format_game_clock(self, seconds):
+        """Format the game clock, switching to SS.t in the final minute if enabled"""
+        if self.show_tenths and seconds < 60:
+            tenths = int(math.ceil(seconds * 10))
+            return f"{tenths // 10:02d}.{tenths % 10}"
+        return self.seconds_to_ms(seconds)
+    
+    def clock_valid_until(self, seconds):
+        """Lowest remaining time the game clock still shows the same as it does for seconds"""
+        if self.show_tenths and seconds < 60:
+            return (math.ceil(seconds * 10) - 1) / 10
+        if self.show_tenths:
+            return max(math.ceil(seconds) - 1, 60)  # under a minute the display switches to tenths
+        return math.ceil(seconds) - 1
+    
     def hms_to_seconds(self, hms_str):
         """Convert HH:MM:SS string to seconds"""
         try:
@@ -295,17 +867,27 @@ class LacrosseTimerApp:
         
         self.quarter_label = tk.Label(
             self.quarter_frame,
-            text=f"Quarter: {self.quarter}/4",
+            text=f"Quarter: {self.engine.quarter}/4",
             font=("Arial", 16, "bold"),
             bg="#004080",
             fg="white"
         )
         self.quarter_label.pack(side=tk.LEFT, padx=10)
         
+        # next penalty to come out, straight from the engine's expiry queue
+        self.next_out_label = tk.Label(
+            self.quarter_frame,
+            text="",
+            font=("Arial", 11),
+            bg="#004080",
+            fg="#FFD966"
+        )
+        self.next_out_label.pack(side=tk.RIGHT, padx=10)
+        
         # game clock display
         self.game_clock_display = tk.Label(
             self.game_clock_frame,
-            text=self.seconds_to_ms(self.game_clock_time),
+            text=self.format_game_clock(self.engine.game_clock_time),
             font=("Arial", 36, "bold"),
             bg="#004080",
             fg="white"
@@ -350,214 +932,562 @@ class LacrosseTimerApp:
     
     def start_game_clock(self):
         """Start the game clock"""
-        if not self.game_clock_running:
-            self.game_clock_running = True
-            self.update_game_clock()
-            
-            # if we were paused between quarters, resume penalty timers
-            if self.game_paused_between_quarters:
-                self.game_paused_between_quarters = False
-                for index, was_running in self.timer_running_states.items():
-                    if was_running and index in self.timer_frames:
-                        self.start_timer(index)
+        if not self.engine.running:
+            self.engine.start()
+            self.record_times()
+            self.reschedule_tick()
     
     def stop_game_clock(self):
         """Stop the game clock"""
-        self.game_clock_running = False
-        if hasattr(self, 'game_clock_after_id'):
-            self.root.after_cancel(self.game_clock_after_id)
-    
-    def update_game_clock(self):
-        """Update the game clock display"""
-        if self.game_clock_running and self.game_clock_time > 0:
-            self.game_clock_time -= 1
-            self.game_clock_display.config(text=self.seconds_to_ms(self.game_clock_time))
-            self.game_clock_after_id = self.root.after(1000, self.update_game_clock)
-        elif self.game_clock_running and self.game_clock_time <= 0:
-            # quarter has ended
-            self.game_clock_running = False
-            if self.quarter < 4:
-                messagebox.showinfo("Quarter End", f"Quarter {self.quarter} has ended!")
-                # store which timers were running
-                self.timer_running_states = {}
-                for index in list(self.intervals.keys()):
-                    self.timer_running_states[index] = True
-                    self.stop_timer(index)
-                self.game_paused_between_quarters = True
-            else:
-                # game over
-                self.handle_game_over()
+        self.engine.stop()
+        self.reschedule_tick()
+        self.record_times()
+        self.render_clock()
+    
+    def stop_ticker(self):
+        """Cancel the pending master tick"""
+        if self.tick_after_id is not None:
+            self.root.after_cancel(self.tick_after_id)
+            self.tick_after_id = None
+            self.metrics.due = None
+    
+    def schedule_tick(self):
+        """Wake at the next moment any running field's clock display changes"""
+        delays = []
+        for session in self.sessions:
+            engine = session.engine
+            if engine.running:
+                step = 0.1 if session.show_tenths and engine.remaining() <= 60 else 1.0
+                delays.append(engine.time_until_change(step))
+        if delays:
+            # land just past the boundary so the new value is already showing
+            delay = int(min(delays) * 1000) + 1
+            self.metrics.scheduled(delay / 1000)
+            self.tick_after_id = self.root.after(delay, self.tick)
+    
+    def reschedule_tick(self):
+        """Restart the master tick after a clock started, stopped or changed speed"""
+        self.stop_ticker()
+        self.schedule_tick()
+    
+    def tick(self):
+        """Advance every running game clock and its penalty timers together"""
+        self.tick_after_id = None
+        started = self.metrics.tick_started()
+        for session in self.sessions:
+            # a clock in its own process may have ended the quarter by itself, tick collects that too
+            self.run_in(session, session.engine.tick)
+            session.journal.maybe_sync()
+        self.report_lost_engines()
+        self.render_clock()
+        self.schedule_tick()
+        self.metrics.tick_finished(started)
+    
+    def report_lost_engines(self):
+        """Say once for each field whose clock process was lost that its clock now runs in the app"""
+        for session in self.sessions:
+            if session.engine_process:
+                failure = session.engine.take_failure()
+                if failure is not None:
+                    self.notices.post(
+                        f"{session.name}: {failure}, its clock carries on in the app", kind="error", seconds=None
+                    )
+    
+    def on_engine_event(self, event, data):
+        """React to quarter ends, game over and expired penalties from the engine"""
+        if event == "penalty_expired":
+            index = data["index"]
+            if index in self.timer_data:
+                player = self.timer_data[index]["player_number"] or f"Timer {index}"
+                # the penalty is served, let the player out
+                self.mark_released(index, "served")
+                self.flash_timer(index)
+                self.notices.post(self.titled(f"Penalty served: {player}"), group="served")
+        elif event == "quarter_end":
+            self.archive_call(self.archive.end_quarter, self.archive_game_id, data["quarter"])
+            self.record_game()
+            self.render_clock()
+            self.notices.post(self.titled(f"Quarter {data['quarter']} has ended!"), seconds=6.0)
+        elif event in ("started", "stopped"):
+            self.metrics.clock_changed(self.session.name)
+        elif event == "game_over":
+            self.archive_call(self.archive.end_quarter, self.archive_game_id, self.engine.quarter)
+            self.close_archived_game()
+            self.record_game()
+            self.render_clock()
+            self.handle_game_over()
+    
+    def flash_timer(self, index):
+        """Blink a timer's row for three seconds to show its penalty is served"""
+        now = self.animator.clock()
+        if not any(session.flashing for session in self.sessions):
+            self.flash_started = now
+        self.flashing[index] = now + 3.0
+        self.animator.start("flash", self.animate_flashes)
+    
+    def animate_flashes(self, now):
+        """One frame of every field's completion flashes, True while any is still running"""
+        lit = int((now - self.flash_started) / 0.5) % 2 == 0
+        for session in self.sessions:
+            for index, ends in list(session.flashing.items()):
+                if now >= ends:
+                    del session.flashing[index]
+                if session is self.shown and index in self.visible_rows:
+                    color = "#FFCCCC" if lit and index in session.flashing else "white"  # light red background
+                    self.view.set(self.visible_rows[index]["frame"], "bg", color)
+        return any(session.flashing for session in self.sessions)
+    
+    def add_session(self, session):
+        """Start hosting a game, driven by the shared tick"""
+        self.sessions.append(session)
+        self.sessions.sort(key=lambda session: session.number)
+        session.engine.subscribe(
+            lambda event, data, session=session: self.run_in(session, self.on_engine_event, event, data)
+        )
+    
+    def run_in(self, session, method, *args):
+        """Call method with session as the game being acted on, on screen or not"""
+        current = self.session
+        self.session = session
+        try:
+            return method(*args)
+        finally:
+            self.session = current
+    
+    def shown_rows(self):
+        """Timer index -> row for the game being acted on, empty when that game isn't on screen"""
+        return self.visible_rows if self.session is self.shown else {}
+    
+    def titled(self, title):
+        """Dialog title naming the field once there is more than one"""
+        return f"{self.session.name}: {title}" if len(self.sessions) > 1 else title
+    
+    def restore_session(self):
+        """Load the current session's saved game and start hosting it"""
+        data = self.read_saved_state()
+        if data is not None:
+            self.engine.new_game(data.get("quarter_length", 12 * 60))
+        self.add_session(self.session)
+        self.restore_state(data)
+        self.render_tabs()
+    
+    def add_field(self):
+        """Host another game on a new field and show it"""
+        self.select_quarter_length()
+        number = max(session.number for session in self.sessions) + 1
+        session = GameSession(number, self.quarter_length, self.snapshot_writer, self.engine_process)
+        self.add_session(session)
+        self.run_in(session, self.restore_state, None)
+        self.show_session(session)
+        self.report_lost_engines()
+    
+    def close_field(self):
+        """Finish the game on the field on screen and stop hosting it"""
+        if len(self.sessions) <= 1:
+            messagebox.showinfo("Cannot Close", "At least one field must stay open.")
+            return
+        confirm = messagebox.askyesno(
+            "Confirm Close Field",
+            f"Close {self.session.name}? Its game stays in the archive but its saved timers are removed."
+        )
+        if not confirm:
+            return
+        
+        session = self.session
+        self.engine.stop()
+        self.close_archived_game()
+        session.journal.delete()
+        session.close()
+        self.sessions.remove(session)
+        self.view.forget(session.tab)
+        session.tab.destroy()
+        self.show_session(self.sessions[0])
+        self.reschedule_tick()
+    
+    def show_session(self, session):
+        """Put another field's game on screen, rebinding the shared rows to its timers"""
+        self.unbind_rows()
+        self.session = self.shown = session
+        self.canvas.yview_moveto(0)
+        self.refresh_rows()
+        self.render_tabs()
+        self.render_clock()
+    
+    def render_tabs(self):
+        """Build missing tab buttons and highlight the field on screen"""
+        for session in self.sessions:
+            if session.tab is None:
+                session.tab = tk.Button(
+                    self.tab_bar,
+                    text=session.name,
+                    command=lambda session=session: self.show_session(session),
+                    font=("Arial", 11),
+                    bd=0,
+                    padx=8
+                )
+            session.tab.pack_forget()
+        for session in self.sessions:
+            session.tab.pack(side=tk.LEFT, padx=2)
+            shown = session is self.shown
+            self.view.set(session.tab, "bg", "white" if shown else "#3395FF")
+            self.view.set(session.tab, "fg", "#007BFF" if shown else "white")
+        if len(self.sessions) == 1:
+            # render_clock stops updating the tab, so take the clock back off it
+            self.view.set(self.sessions[0].tab, "text", self.sessions[0].name)
+    
+    def render_clock(self):
+        """Draw the game clock and penalty timers as one batch of changed values"""
+        if self.session is not self.shown:
+            return  # a game on another field, its tab is refreshed with the next frame
+        
+        if self.scoreboard is not None:
+            self.scoreboard.publish(self.scoreboard_state())
+        
+        # every tab shows its field's quarter and clock once there is more than one
+        if len(self.sessions) > 1:
+            for session in self.sessions:
+                clock = self.run_in(session, self.format_game_clock, session.engine.remaining())
+                self.view.set(session.tab, "text", f"{session.name}  Q{session.engine.quarter} {clock}")
+        
+        self.view.set(self.quarter_label, "text", f"Quarter: {self.engine.quarter}/4")
+        clock_text = self.format_game_clock(self.engine.game_clock_time)
+        self.view.set(self.game_clock_display, "text", clock_text)
+        for index, row in self.visible_rows.items():
+            self.view.set(row["time_display"], "text", self.seconds_to_hms(self.engine.penalty_remaining(index)))
+        
+        upcoming = self.engine.next_release()
+        if upcoming is not None and upcoming[0] in self.timer_data:
+            index, seconds = upcoming
+            player = self.timer_data[index]["player_number"] or f"Timer {index}"
+            self.view.set(self.next_out_label, "text", f"Next out: {player} in {self.seconds_to_ms(seconds)}")
+        else:
+            self.view.set(self.next_out_label, "text", "")
+        
+        if self.board is not None:
+            self.board.render()
+        self.view.flush()
+        
+        if self.engine.running:
+            # the new value is up, see how long the one it replaced stayed after it went out of date
+            self.metrics.sample_drift(
+                self.session.name, clock_text, self.clock_valid_until(self.engine.game_clock_time), self.engine.remaining()
+            )
+    
+    def scoreboard_state(self):
+        """Every field's quarter, clock and penalties being served, as shown to network displays"""
+        state = {}
+        for session in self.sessions:
+            engine = session.engine
+            penalties = {}
+            timers = session.timer_data.snapshot
+            for index in timers:
+                remaining = engine.penalty_remaining(index)
+                if remaining > 0:
+                    timer_data = timers[index]
+                    penalties[str(index)] = {
+                        "player": timer_data["player_number"] or f"Timer {index}",
+                        "team": timer_data["team_name"],
+                        "remaining": self.seconds_to_ms(remaining)
+                    }
+            state[session.name] = {
+                "quarter": engine.quarter,
+                "clock": self.run_in(session, self.format_game_clock, engine.game_clock_time),
+                "penalty": penalties
+            }
+        return state
+    
+    def toggle_board(self):
+        """Open or close the spectator board"""
+        if self.board is None:
+            self.board = SpectatorBoard(self)
+        else:
+            self.board.close()
     
     def next_quarter(self):
         """Move to the next quarter"""
-        if self.quarter < 4:
-            self.quarter += 1
-            self.game_clock_time = self.quarter_length
-            self.quarter_label.config(text=f"Quarter: {self.quarter}/4")
-            self.game_clock_display.config(text=self.seconds_to_ms(self.game_clock_time))
-            messagebox.showinfo("Next Quarter", f"Starting Quarter {self.quarter}")
+        if self.engine.next_quarter():
+            self.record_game()
+            self.render_clock()
+            self.notices.post(self.titled(f"Starting Quarter {self.engine.quarter}"))
         else:
-            messagebox.showinfo("Game Over", "The game is already in the final quarter!")
+            self.notices.post(self.titled("The game is already in the final quarter!"), kind="warning")
     
     def handle_game_over(self):
         """Handle end of game actions"""
-        response = messagebox.askyesno("Game Over", "Game over, do you want to save the game data to a Word file?")
-        if response:
-            self.export_to_word()
+        session = self.session
+        self.notices.post(
+            self.titled("Game over! Save the game data to a Word file?"),
+            seconds=None,
+            action=("Export to Word", lambda: self.run_in(session, self.export_to_word))
+        )
     
     def add_timer(self):
         """Add a new timer"""
-        new_index = max(self.timer_frames.keys(), default=0) + 1
+        new_index = max(self.timer_order, default=0) + 1
         self.create_timer(new_index)
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.record_timer(new_index)
+        self.refresh_rows()
 
     def remove_timer(self):
         """Remove the last timer"""
-        if len(self.timer_frames) <= 1:
+        if len(self.timer_data) <= 1:
             messagebox.showinfo("Cannot Remove", "You must have at least one timer.")
             return
         
-        last_index = max(self.timer_frames.keys())
+        last_index = self.timer_order[-1]
         self.remove_specific_timer(last_index)
 
     def stop_timer(self, index):
         """Stop the timer with the given index"""
-        if index in self.intervals:
-            self.root.after_cancel(self.intervals[index])
-            del self.intervals[index]
+        self.engine.stop_penalty(index)
+        if index in self.timer_data:
+            self.record_timer(index, "paused_time")
 
     def start_all_timers(self):
         """Start all active timers"""
-        if not self.game_clock_running:
+        if not self.engine.running:
             messagebox.showinfo("Game Clock Stopped", "Please start the game clock first.")
             return
 
-        for index in self.timer_frames:
-            if self.paused_times[index] > 0:
-                self.start_timer(index)
+        self.engine.start_all_penalties()
 
     def stop_all_timers(self):
         """Stop all running timers"""
-        for index in list(self.intervals.keys()):
-            self.stop_timer(index)
+        self.engine.stop_all_penalties()
 
     def resume_all_timers(self):
         """Resume all paused timers"""
-        if not self.game_clock_running:
+        if not self.engine.running:
             messagebox.showinfo("Game Clock Stopped", "Please start the game clock first.")
             return
         
-        for index in self.timer_frames:
-            if self.paused_times[index] > 0:
-                self.start_timer(index)
+        self.engine.start_all_penalties()
 
+    def snapshot_state(self):
+        """The full app state in the saved JSON layout"""
+        data = {
+            "quarter": self.engine.quarter,
+            "quarter_length": self.engine.quarter_length,
+            "game_clock_time": self.engine.remaining(),
+            "show_tenths": self.show_tenths,
+            "archive_game_id": self.archive_game_id,
+            "timers": {}
+        }
+        
+        # save timer data, all from one snapshot of the timers
+        timers = self.timer_data.snapshot
+        for index in timers:
+            data["timers"][str(index)] = dict(
+                timers[index],
+                paused_time=self.engine.penalty_remaining(index)
+            )
+        return data
+    
+    def record(self, op, **fields):
+        """Append one action to the journal, compacting it once it grows long"""
+        try:
+            self.journal.append(dict(fields, op=op))
+            if self.journal.needs_compaction():
+                self.checkpoint()
+        except OSError as e:
+            self.notices.post(f"Failed to save data: {str(e)}", kind="error", seconds=None, group="save error")
+    
+    def record_game(self):
+        """Journal the quarter, clock and settings"""
+        self.record(
+            "game",
+            quarter=self.engine.quarter,
+            quarter_length=self.engine.quarter_length,
+            game_clock_time=self.engine.remaining(),
+            show_tenths=self.show_tenths,
+            archive_game_id=self.archive_game_id
+        )
+    
+    def record_timer(self, index, *keys):
+        """Journal the given fields of one timer (all of them by default) and its remaining time"""
+        fields = self.timer_data[index]
+        self.record(
+            "timer",
+            index=index,
+            paused_time=self.engine.penalty_remaining(index),
+            **{key: fields[key] for key in (keys or fields) if key in fields}
+        )
+    
+    def record_times(self):
+        """Journal the game clock and every timer's remaining time"""
+        self.record(
+            "times",
+            game_clock_time=self.engine.remaining(),
+            timers={str(index): self.engine.penalty_remaining(index) for index in self.timer_order}
+        )
+    
+    def record_reset(self):
+        """Journal that every timer was dropped, then the fresh timers that replace them"""
+        self.record("clear")
+        for index in self.timer_order:
+            self.record_timer(index)
+    
+    def archive_call(self, method, *args, **kwargs):
+        """Run an archive update, reporting a failure without interrupting the game"""
+        try:
+            return method(*args, **kwargs)
+        except sqlite3.Error as e:
+            self.view.set(self.save_status_label, "text", f"⚠ Archive failed: {e}")
+            return None
+    
+    def start_archived_game(self):
+        """Open this game's row in the archive"""
+        self.archive_game_id = self.archive_call(self.archive.start_game, self.engine.quarter_length)
+        self.record_game()
+    
+    def close_archived_game(self):
+        """Store the final details of every open penalty and mark the game finished"""
+        if self.archive_game_id is None:
+            return
+        for index in self.timer_order:
+            self.archive_penalty(index)
+        self.archive_call(self.archive.end_game, self.archive_game_id)
+    
+    def archive_penalty(self, index, release=None):
+        """Add or update the archived penalty a timer is serving, closing it when the player comes out"""
+        fields = self.timer_data[index]
+        if self.archive_game_id is None:
+            return
+        
+        columns = {
+            "player": fields["player_number"].replace(" (Released)", ""),
+            "team": fields["team_name"],
+            "penalty_type": fields["penalty_type"],
+            "game_time": fields["penalty_time"]
+        }
+        if fields["time_option"] != "Not in use":
+            columns["duration"] = self.hms_to_seconds(fields["time_option"])
+        
+        penalty_id = fields["archive_id"]
+        if penalty_id is None:
+            if "duration" not in columns:
+                return  # no penalty on this timer
+            penalty_id = self.archive_call(
+                self.archive.add_penalty, self.archive_game_id, self.engine.quarter, **columns
+            )
+            self.timer_data.update(index, archive_id=penalty_id)
+            self.record_timer(index, "archive_id")
+        else:
+            self.archive_call(self.archive.update_penalty, penalty_id, **columns)
+        
+        # keep the report's row for this penalty in step
+        if penalty_id is not None:
+            duration = fields["time_option"] if "duration" in columns else None
+            self.report.set_penalty(penalty_id, (
+                columns["player"], columns["team"], columns["penalty_type"], columns["game_time"], duration
+            ))
+        
+        if release is not None and penalty_id is not None:
+            self.archive_call(
+                self.archive.update_penalty, penalty_id,
+                released_at=self.seconds_to_ms(self.engine.remaining()), release=release
+            )
+            self.timer_data.update(index, archive_id=None)
+            self.record_timer(index, "archive_id")
+    
+    def checkpoint(self):
+        """Fold the journal into a fresh JSON snapshot, written in the background"""
+        self.journal.compact(self.snapshot_state())
+        self.view.set(self.save_status_label, "text", "Saving…")
+        if self.save_poll_id is None:
+            self.save_poll_id = self.root.after(100, self.poll_save)
+    
+    def poll_save(self):
+        """Show how the background snapshot write went once it finishes"""
+        writer = self.journal.writer
+        if writer.busy():
+            self.save_poll_id = self.root.after(100, self.poll_save)
+            return
+        
+        self.save_poll_id = None
+        if writer.error is not None:
+            self.view.set(self.save_status_label, "text", f"⚠ Save failed: {writer.error}")
+        else:
+            saved_at = datetime.fromtimestamp(writer.last_written).strftime("%H:%M:%S")
+            self.view.set(self.save_status_label, "text", f"✓ Saved {saved_at}")
+    
     def save_data(self):
-        """Save the app state to a JSON file"""
+        """Save the app state to a JSON file without pausing the clock"""
         try:
-            data = {
-                "quarter": self.quarter,
-                "quarter_length": self.quarter_length,
-                "game_clock_time": self.game_clock_time,
-                "timers": {}
-            }
-
-            # save timer data
-            for index, timer_data in self.timer_frames.items():
-                data["timers"][str(index)] = {
-                    "player_number": timer_data["player_entry"].get(),
-                    "team_name": timer_data["team_entry"].get(),
-                    "penalty_type": timer_data["penalty_var"].get(),
-                    "penalty_time": timer_data["penalty_time_entry"].get(),
-                    "time_option": timer_data["time_var"].get(),
-                    "paused_time": self.paused_times[index]
-                }
-
-            with open("lacrosse_timer_data.json", "w") as f:
-                json.dump(data, f)
-
-            messagebox.showinfo("Save Successful", "Game data has been saved.")
+            self.checkpoint()
         except Exception as e:
-            messagebox.showerror("Save Error", f"Failed to save data: {str(e)}")
+            self.view.set(self.save_status_label, "text", f"⚠ Save failed: {str(e)}")
 
     def export_to_word(self):
-        """Export all game data to a Word document"""
-        try:
-            # ask user where to save the file
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".docx",
-                filetypes=[("Word documents", "*.docx")],
-                title="Save Game Data"
-            )
-            
-            if not file_path:
-                return  # sser cancelled
-            
-            # create a new Word document
-            doc = Document()
-            
-            # add title
-            doc.add_heading('Lacrosse Game Report', 0)
-            
-            # add date and time
-            doc.add_paragraph(f"Game Date: {datetime.now().strftime('%Y-%m-%d')}")
-            doc.add_paragraph(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            # add a horizontal line
-            doc.add_paragraph('_' * 50)
-            
-            # game summary section
-            doc.add_heading('Game Summary', level=1)
-            doc.add_paragraph(f"Total Quarters Played: {self.quarter}")
-            doc.add_paragraph(f"Quarter Length: {self.quarter_length // 60} minutes")
-            
-            # penalty summary
-            doc.add_heading('Penalty Summary', level=1)
-            
-            # create a table for penalties
-            table = doc.add_table(rows=1, cols=5)
-            table.style = 'Table Grid'
-            
-            # add header row
-            header_cells = table.rows[0].cells
-            header_cells[0].text = 'Player Number'
-            header_cells[1].text = 'Team Name'
-            header_cells[2].text = 'Penalty Type'
-            header_cells[3].text = 'Penalty Time'
-            header_cells[4].text = 'Penalty Duration'
-            
-            # add data rows
-            for index, timer_data in self.timer_frames.items():
-                player_number = timer_data["player_entry"].get()
-                team_name = timer_data["team_entry"].get()
-                penalty_type = timer_data["penalty_var"].get()
-                penalty_time = timer_data["penalty_time_entry"].get()
-                penalty_duration = timer_data["time_var"].get()
-                
-                # only add rows with actual data
-                if player_number or team_name or penalty_type != "Select Penalty Type":
-                    row_cells = table.add_row().cells
-                    row_cells[0].text = player_number
-                    row_cells[1].text = team_name
-                    row_cells[2].text = penalty_type
-                    row_cells[3].text = penalty_time
-                    row_cells[4].text = penalty_duration
-            
-            # add footer
-            doc.add_paragraph('_' * 50)
-            doc.add_paragraph('Generated by Lacrosse Timer App - © Dan Finn')
-            
-            # save the document
-            doc.save(file_path)
-            messagebox.showinfo("Export Successful", f"Game data has been exported to {file_path}")
-            
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export data: {str(e)}")
+        """Export all game data to a Word document without holding up the clock"""
+        # ask user where to save the file
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".docx",
+            filetypes=[("Word documents", "*.docx")],
+            title="Save Game Data"
+        )
+        
+        if not file_path:
+            return  # user cancelled
+        
+        # bring the rows of penalties still being served up to date, then hand over the summary
+        for index in self.timer_order:
+            self.archive_penalty(index)
+        self.report.export(file_path, {
+            "quarter": self.engine.quarter,
+            "quarter_length": self.engine.quarter_length
+        })
+        self.view.set(self.save_status_label, "text", "Exporting report…")
+        if self.export_poll_id is None:
+            self.export_poll_id = self.root.after(100, self.poll_export)
+    
+    def export_penalties(self):
+        """Export this game's penalties as CSV, JSON Lines or HTML without holding up the clock"""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("Web page", "*.html")],
+            title="Export Penalties"
+        )
+        
+        if not file_path:
+            return  # user cancelled
+        if self.archive_game_id is None:
+            messagebox.showerror("Export Error", "This game could not be archived, there is nothing to export.")
+            return
+        
+        # the worker reads the archive, so bring penalties still being served up to date first
+        for index in self.timer_order:
+            self.archive_penalty(index)
+        self.report.export_rows(file_path, {
+            "quarter": self.engine.quarter,
+            "quarter_length": self.engine.quarter_length
+        }, self.archive.path, self.archive_game_id)
+        self.view.set(self.save_status_label, "text", "Exporting report…")
+        if self.export_poll_id is None:
+            self.export_poll_id = self.root.after(100, self.poll_export)
+    
+    def poll_export(self):
+        """Show export progress until every field's worker finishes"""
+        self.export_poll_id = None
+        running = [progress for progress in (session.report.progress() for session in self.sessions) if progress is not None]
+        if running:
+            self.view.set(self.save_status_label, "text", f"Exporting report {int(min(running) * 100)}%")
+            self.export_poll_id = self.root.after(100, self.poll_export)
+        
+        for session in self.sessions:
+            for outcome, detail in session.report.take_results():
+                if outcome == "saved":
+                    self.view.set(self.save_status_label, "text", "✓ Report exported")
+                    self.notices.post(f"Game data has been exported to {detail}")
+                else:
+                    self.view.set(self.save_status_label, "text", "⚠ Export failed")
+                    self.notices.post(f"Failed to export data: {detail}", kind="error", seconds=None)
     
     def open_settings(self):
         """Open the settings dialog"""
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Settings")
-        settings_window.geometry("400x450")
+        settings_window.geometry("400x610")
         settings_window.transient(self.root)
         settings_window.grab_set()
         
@@ -567,10 +1497,26 @@ class LacrosseTimerApp:
         
         tk.Label(quarter_frame, text="Quarter Length (minutes):").pack(side=tk.LEFT)
         
-        quarter_length_var = tk.StringVar(value=str(self.quarter_length // 60))
+        quarter_length_var = tk.StringVar(value=str(self.engine.quarter_length // 60))
         quarter_entry = tk.Entry(quarter_frame, textvariable=quarter_length_var, width=5)
         quarter_entry.pack(side=tk.LEFT, padx=10)
         
+        # tenths of a second in the final minute
+        tenths_var = tk.BooleanVar(value=self.show_tenths)
+        tk.Checkbutton(
+            settings_window,
+            text="Show tenths in the final minute",
+            variable=tenths_var
+        ).pack(anchor="w", padx=20)
+        
+        # compact binary save file, quicker to restore than JSON
+        binary_var = tk.BooleanVar(value=self.journal.binary)
+        tk.Checkbutton(
+            settings_window,
+            text="Compact binary save file",
+            variable=binary_var
+        ).pack(anchor="w", padx=20)
+        
         # time adjustment controls
         adjust_frame = tk.LabelFrame(settings_window, text="Manual Time Override", pady=10, padx=10)
         adjust_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -626,6 +1572,16 @@ class LacrosseTimerApp:
             font=("Arial", 12)
         ).pack(fill=tk.X, pady=5)
         
+        # CSV, JSON Lines or HTML export button
+        tk.Button(
+            game_frame,
+            text="Export Penalties (CSV, JSON Lines, HTML)",
+            command=self.export_penalties,
+            bg="#007BFF",
+            fg="white",
+            font=("Arial", 12)
+        ).pack(fill=tk.X, pady=5)
+        
         # clear Memory button
         tk.Button(
             game_frame,
@@ -636,6 +1592,23 @@ class LacrosseTimerApp:
             font=("Arial", 12)
         ).pack(fill=tk.X, pady=5)
         
+        # row pool and render layer metrics
+        pool = self.row_pool.stats()
+        tk.Label(
+            game_frame,
+            text=f"Timer rows: {pool['created']} built, {pool['in_use']} in use, {pool['idle']} idle, {pool['reused']} reuses",
+            font=("Arial", 9),
+            fg="#555555"
+        ).pack(anchor="w", pady=(5, 0))
+        
+        updates = self.view.stats()
+        tk.Label(
+            game_frame,
+            text=f"Display updates: {updates['applied']} applied, {updates['skipped']} skipped",
+            font=("Arial", 9),
+            fg="#555555"
+        ).pack(anchor="w")
+        
         # save settings button
         save_frame = tk.Frame(settings_window, pady=10)
         save_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -643,39 +1616,50 @@ class LacrosseTimerApp:
         tk.Button(
             save_frame,
             text="Save Settings",
-            command=lambda: self.save_settings(int(quarter_length_var.get()), settings_window),
+            command=lambda: self.save_settings(
+                int(quarter_length_var.get()), tenths_var.get(), settings_window, binary_var.get()
+            ),
             bg="#007BFF",
             fg="white",
             font=("Arial", 12, "bold")
         ).pack(fill=tk.X)
     
-    def save_settings(self, quarter_length_minutes, settings_window):
+    def save_settings(self, quarter_length_minutes, show_tenths, settings_window, binary_snapshot=False):
         """Save the settings and close the settings window"""
-        self.quarter_length = quarter_length_minutes * 60
+        self.engine.quarter_length = quarter_length_minutes * 60
+        self.show_tenths = show_tenths
+        
+        # switching the save file format takes effect with a fresh snapshot
+        if binary_snapshot != self.journal.binary:
+            self.journal.binary = binary_snapshot
+            self.checkpoint()
         
         # if we're in a new quarter, update the time
-        if self.game_clock_time == self.quarter_length or self.game_clock_time == 0:
-            self.game_clock_time = self.quarter_length
-            self.game_clock_display.config(text=self.seconds_to_ms(self.game_clock_time))
+        self.engine.settle()
+        if self.engine.game_clock_time == self.engine.quarter_length or self.engine.game_clock_time == 0:
+            self.engine.game_clock_time = self.engine.quarter_length
+        self.record_game()
+        self.metrics.clock_changed(self.session.name)  # a new display mode, not a late value
+        self.render_clock()
+        
+        # the tick rate depends on the display mode
+        if self.engine.running:
+            self.reschedule_tick()
         
         settings_window.destroy()
-        messagebox.showinfo("Settings Saved", "Your settings have been saved.")
+        self.notices.post("Your settings have been saved.")
     
     def adjust_all_timers(self, seconds_to_adjust):
         """Adjust all timers by the specified number of seconds"""
-        # adjust game clock
-        self.game_clock_time = max(0, self.game_clock_time + seconds_to_adjust)
-        self.game_clock_display.config(text=self.seconds_to_ms(self.game_clock_time))
+        self.engine.adjust_all(seconds_to_adjust)
         
-        # adjust penalty timers
-        for index in self.paused_times:
-            if self.paused_times[index] > 0:  # only adjust active timers
-                self.paused_times[index] = max(0, self.paused_times[index] + seconds_to_adjust)
-                if index in self.timer_frames:
-                    self.timer_frames[index]["time_display"].config(text=self.seconds_to_hms(self.paused_times[index]))
+        self.metrics.clock_changed(self.session.name)  # the jump is not the display falling behind
+        self.render_clock()
+        if self.engine.running:
+            self.reschedule_tick()
         
         # save the updated state
-        self.save_data()
+        self.record_times()
     
     def start_new_game(self):
         """Start a new game with fresh settings"""
@@ -688,31 +1672,26 @@ class LacrosseTimerApp:
             # show quarter length selection dialog
             self.select_quarter_length()
             
-            # reset game state
-            self.quarter = 1
-            self.game_clock_time = self.quarter_length
-            self.game_paused_between_quarters = False
-            
-            # update game clock display
-            self.quarter_label.config(text=f"Quarter: {self.quarter}/4")
-            self.game_clock_display.config(text=self.seconds_to_ms(self.game_clock_time))
+            # reset game state, the finished game stays in the archive
+            self.close_archived_game()
+            self.engine.new_game(self.quarter_length)
+            self.start_archived_game()
+            self.report.reset()
             
             # clear all timers
-            for index in list(self.timer_frames.keys()):
-                self.timer_frames[index]["frame"].destroy()
-            
-            self.timer_frames = {}
-            self.intervals = {}
-            self.paused_times = {}
-            self.timer_running_states = {}
+            self.clear_timer_data()
             
             # initialize new timers
             self.initialize_timers()
             
-            # save the new state
-            self.save_data()
+            # update game clock display
+            self.render_clock()
+            
+            # journal the reset as well, a crash before the snapshot is written must not replay the old timers
+            self.record_reset()
+            self.checkpoint()
             
-            messagebox.showinfo("New Game", "New game has been started.")
+            self.notices.post(self.titled("New game has been started."))
     
     def clear_memory(self):
         """Clear all current page data without starting a new game"""
@@ -722,205 +1701,228 @@ class LacrosseTimerApp:
             self.stop_all_timers()
             
             # clear all timers
-            for index in list(self.timer_frames.keys()):
-                self.timer_frames[index]["frame"].destroy()
-            
-            self.timer_frames = {}
-            self.intervals = {}
-            self.paused_times = {}
-            self.timer_running_states = {}
+            self.clear_timer_data()
+            self.engine.clear_penalties()
             
             # initialize new timers
             self.initialize_timers()
             
-            # save the new state
-            self.save_data()
+            # journal the reset as well, a crash before the snapshot is written must not replay the old timers
+            self.record_reset()
+            self.checkpoint()
             
-            messagebox.showinfo("Memory Cleared", "All timer data has been cleared.")
+            self.notices.post(self.titled("All timer data has been cleared."))
     
     def exit_application(self):
         """Save data and exit the application"""
         confirm = messagebox.askyesno("Confirm Exit", "Are you sure you want to exit? Your data will be saved automatically.")
         if confirm:
-            self.save_data()
+            try:
+                # closing the writer waits for every field's final snapshot to reach the disk
+                for session in self.sessions:
+                    self.run_in(session, self.checkpoint)
+                    session.journal.close()
+                    session.close()
+                self.snapshot_writer.close()
+                self.archive.close()
+                if self.scoreboard is not None:
+                    self.scoreboard.stop()
+                if self.snapshot_writer.error is not None:
+                    raise self.snapshot_writer.error
+            except Exception as e:
+                messagebox.showerror("Save Error", f"Failed to save data: {str(e)}")
             self.root.destroy()
     
+    def metrics_text(self):
+        """Tick metrics and render counters in the Prometheus text format, also served at /metrics"""
+        lines = [
+            "# HELP lax_render_changes_total Display changes applied, and skipped because nothing changed",
+            "# TYPE lax_render_changes_total counter",
+            f'lax_render_changes_total{{result="applied"}} {self.view.applied}',
+            f'lax_render_changes_total{{result="skipped"}} {self.view.skipped}'
+        ]
+        if self.scoreboard is not None:
+            lines.append("# HELP lax_scoreboard_displays Displays connected to the scoreboard server")
+            lines.append("# TYPE lax_scoreboard_displays gauge")
+            lines.append(f"lax_scoreboard_displays {self.scoreboard.clients()}")
+        return self.metrics.prometheus() + "\n".join(lines) + "\n"
+    
+    def dump_metrics(self, event=None):
+        """Write the metrics to a file for post-game analysis"""
+        path = datetime.now().strftime("lacrosse_metrics_%Y%m%d_%H%M%S.prom")
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.metrics_text())
+        except OSError as e:
+            self.notices.post(f"Failed to write metrics: {e}", kind="error", seconds=None)
+        else:
+            self.notices.post(f"Metrics written to {path}")
+        return "break"
+    
     def toggle_fullscreen(self, event=None):
         """Toggle fullscreen mode"""
         state = not self.root.attributes("-fullscreen")
         self.root.attributes("-fullscreen", state)
-        if state:
-            # adjust timer sizes for fullscreen
-            for timer_frame in self.timer_frames.values():
-                timer_frame["frame"].config(width=400)  # set a fixed width for timers in fullscreen
+        self.schedule_layout()
         return "break"
     
     def end_fullscreen(self, event=None):
         """End fullscreen mode"""
         self.root.attributes("-fullscreen", False)
+        self.schedule_layout()
         return "break"
     
-    def adjust_timer_sizes(self, event=None):
-        """Adjust timer sizes based on window size"""
-        if hasattr(self, 'timer_frames'):
-            window_width = self.root.winfo_width()
-            
-            # if window is very wide, limit timer width
-            if window_width > 1200:
-                max_width = min(600, window_width // 2)
-                for index in self.timer_frames:
-                    self.timer_frames[index]["frame"].config(width=max_width)
+    def schedule_layout(self, event=None):
+        """Queue one layout pass for the next idle moment, however many configure events arrive"""
+        # the root binding also sees every child widget's configure
+        if event is not None and event.widget not in (self.root, self.canvas):
+            return
+        if self.layout_after_id is None:
+            self.layout_after_id = self.root.after_idle(self.run_layout)
+    
+    def run_layout(self):
+        """Work out the timer row width once and lay out the visible rows"""
+        self.layout_after_id = None
+        width = max(1, self.canvas.winfo_width() - 20)
+        
+        # if window is very wide, limit timer width
+        window_width = self.root.winfo_width()
+        if window_width > 1200:
+            width = min(width, 600, window_width // 2)
+        
+        self.row_width = width
+        self.refresh_rows()
     
     def setup_timer(self, index):
         """Set up the timer with the selected time"""
-        if index in self.timer_frames:
-            time_str = self.timer_frames[index]["time_var"].get()
+        if index in self.timer_data:
+            time_str = self.timer_data[index]["time_option"]
             if time_str != "Not in use":
                 seconds = self.hms_to_seconds(time_str)
-                self.paused_times[index] = seconds
-                self.timer_frames[index]["time_display"].config(text=time_str)
-            
+                self.engine.set_penalty(index, seconds)
+                
                 # auto-fill penalty time with current game clock time
-                if not self.timer_frames[index]["penalty_time_entry"].get():
-                    game_time = self.seconds_to_ms(self.game_clock_time)
-                    self.timer_frames[index]["penalty_time_entry"].delete(0, tk.END)
-                    self.timer_frames[index]["penalty_time_entry"].insert(0, game_time)
+                if not self.timer_data[index]["penalty_time"]:
+                    game_time = self.seconds_to_ms(self.engine.remaining())
+                    self.update_timer_fields(index, penalty_time=game_time)
             else:
-                self.paused_times[index] = 0
-                self.timer_frames[index]["time_display"].config(text="00:00:00")
-
+                self.engine.set_penalty(index, 0)
+            self.archive_penalty(index)
+            self.record_timer(index, "time_option", "penalty_time")
+            self.render_clock()
+    
     def released_timer(self, index):
         """Mark a player as released and clear the timer"""
-        if index in self.timer_frames:
-            # stop the timer if running
-            self.stop_timer(index)
-        
-            # reset the timer display
-            self.paused_times[index] = 0
-            self.timer_frames[index]["time_display"].config(text="00:00:00")
-            self.timer_frames[index]["time_var"].set("Not in use")
-        
-            # add "Released" to the player number
-            current_player = self.timer_frames[index]["player_entry"].get()
-            if current_player and "Released" not in current_player:
-                self.timer_frames[index]["player_entry"].delete(0, tk.END)
-                self.timer_frames[index]["player_entry"].insert(0, f"{current_player} (Released)")
-            
-            # save the updated state
-            self.save_data()
-
+        if index in self.timer_data:
+            # stop the timer and clear its time
+            self.engine.release(index)
+            self.mark_released(index, "released")
+    
+    def mark_released(self, index, release):
+        """Reset a timer's fields and tag the player as released"""
+        # close the archived penalty while its duration is still on the timer
+        self.archive_penalty(index, release)
+        fields = {"time_option": "Not in use"}
+        
+        # add "Released" to the player number
+        current_player = self.timer_data[index]["player_number"]
+        if current_player and "Released" not in current_player:
+            fields["player_number"] = f"{current_player} (Released)"
+        
+        self.update_timer_fields(index, **fields)
+        self.record_timer(index, *fields)
+        self.render_clock()
+    
     def remove_specific_timer(self, index):
         """Remove a specific timer by its index"""
-        if len(self.timer_frames) <= 1:
+        if len(self.timer_data) <= 1:
             messagebox.showinfo("Cannot Remove", "You must have at least one timer.")
             return
         
-        # stop the timer if running
-        self.stop_timer(index)
-    
-        # remove the timer frame
-        if index in self.timer_frames:
-            self.timer_frames[index]["frame"].destroy()
-            del self.timer_frames[index]
-        
-            # remove from paused_times
-            if index in self.paused_times:
-                del self.paused_times[index]
-        
+        # remove the timer from the model, its row goes back to the pool
+        if index in self.timer_data:
+            self.archive_penalty(index)
+            self.timer_data.remove(index)
+            self.flashing.pop(index, None)
+            self.unbind_rows([index])
+            
+            # stop tracking its time
+            self.engine.remove_penalty(index)
+            
             # update scroll region
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            self.refresh_rows()
             
             # save the updated state
-            self.save_data()
-
+            self.record("remove", index=index)
+    
     def start_timer(self, index):
         """Start the timer with the given index"""
-        if index not in self.timer_frames or not self.game_clock_running:
+        if index not in self.timer_data:
             return
+        
+        # the master tick advances every running penalty in the engine
+        self.engine.start_penalty(index)
+        self.record_timer(index, "paused_time")
     
-        # stop existing timer if running
-        self.stop_timer(index)
+    def read_saved_state(self):
+        """Read the JSON snapshot and the journal written after it, or None if there is no saved game"""
+        try:
+            return self.journal.load()
+        except Exception as e:
+            messagebox.showerror("Load Error", f"Failed to load data: {str(e)}")
+            return None
     
-        # start a new timer
-        if self.paused_times[index] > 0:
-            self.intervals[index] = self.root.after(1000, lambda: self.update_timer(index))
-
-    def update_timer(self, index):
-        """Update the timer display and decrement the time"""
-        if index not in self.timer_frames or index not in self.paused_times:
+    def restore_state(self, data):
+        """Build the timers from the saved state, or the default timers when there is none"""
+        if data is None:
+            # nothing saved yet, the default timers are the starting snapshot
+            self.initialize_timers()
+            self.start_archived_game()
+            self.checkpoint()
             return
-    
-        # only update if game clock is running
-        if self.game_clock_running and self.paused_times[index] > 0:
-            self.paused_times[index] -= 1
-            self.timer_frames[index]["time_display"].config(text=self.seconds_to_hms(self.paused_times[index]))
-        
-            # check if timer has reached zero
-            if self.paused_times[index] <= 0:
-                # timer completed
-                self.stop_timer(index)
-                # play a sound or flash the timer to indicate completion
-                self.timer_frames[index]["frame"].config(bg="#FFCCCC")  # light red background
-                self.root.after(3000, lambda: self.timer_frames[index]["frame"].config(bg="white"))  # reset after 3 seconds
-            else:
-                # continue the timer
-                self.intervals[index] = self.root.after(1000, lambda: self.update_timer(index))
-        elif not self.game_clock_running:
-            # pause timer if game clock is stopped
-            self.stop_timer(index)
-
-    def load_data(self):
-        """Load the app state from a JSON file"""
-        try:
-            if not os.path.exists("lacrosse_timer_data.json"):
-                return
         
-            with open("lacrosse_timer_data.json", "r") as f:
-                data = json.load(f)
-        
-            # load game state
-            self.quarter = data.get("quarter", 1)
-            self.quarter_length = data.get("quarter_length", 12 * 60)
-            self.game_clock_time = data.get("game_clock_time", self.quarter_length)
-        
-            # update game clock display
-            self.quarter_label.config(text=f"Quarter: {self.quarter}/4")
-            self.game_clock_display.config(text=self.seconds_to_ms(self.game_clock_time))
-        
-            # clear existing timers
-            for index in list(self.timer_frames.keys()):
-                self.timer_frames[index]["frame"].destroy()
-            self.timer_frames.clear()
-            self.paused_times.clear()
-        
-            # load timer data
-            for index_str, timer_data in data.get("timers", {}).items():
-                index = int(index_str)
-                self.create_timer(index)
-            
-                # set timer values
-                self.timer_frames[index]["player_entry"].insert(0, timer_data.get("player_number", ""))
-                self.timer_frames[index]["team_entry"].insert(0, timer_data.get("team_name", ""))
-                self.timer_frames[index]["penalty_var"].set(timer_data.get("penalty_type", "Select Penalty Type"))
-                self.timer_frames[index]["penalty_time_entry"].insert(0, timer_data.get("penalty_time", ""))
-                self.timer_frames[index]["time_var"].set(timer_data.get("time_option", "Not in use"))
+        # load game state, the engine was created with the saved quarter length
+        self.engine.quarter = data.get("quarter", 1)
+        self.engine.game_clock_time = data.get("game_clock_time", self.engine.quarter_length)
+        self.show_tenths = data.get("show_tenths", False)
+        self.archive_game_id = data.get("archive_game_id")
+        if self.archive_game_id is None:
+            self.start_archived_game()
+        else:
+            # the report picks up the penalties already called this game
+            penalties = self.archive_call(self.archive.game_penalties, self.archive_game_id) or []
+            for penalty_id, player, team, penalty_type, game_time, duration in penalties:
+                self.report.set_penalty(
+                    penalty_id, (player, team, penalty_type, game_time, self.seconds_to_hms(duration))
+                )
+        
+        # load timer data
+        for index_str, timer_data in data.get("timers", {}).items():
+            index = int(index_str)
+            self.create_timer(
+                index,
+                player_number=timer_data.get("player_number", ""),
+                team_name=timer_data.get("team_name", ""),
+                penalty_type=timer_data.get("penalty_type", "Select Penalty Type"),
+                penalty_time=timer_data.get("penalty_time", ""),
+                time_option=timer_data.get("time_option", "Not in use"),
+                archive_id=timer_data.get("archive_id")
+            )
             
-                # set paused time
-                self.paused_times[index] = timer_data.get("paused_time", 0)
-                self.timer_frames[index]["time_display"].config(text=self.seconds_to_hms(self.paused_times[index]))
+            # set paused time
+            self.engine.set_penalty(index, timer_data.get("paused_time", 0))
         
-            messagebox.showinfo("Load Successful", "Game data has been loaded.")
-        except Exception as e:
-            messagebox.showerror("Load Error", f"Failed to load data: {str(e)}")
-
-    def on_frame_configure(self, event):
-        """Reset the scroll region to encompass the inner frame"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.refresh_rows()
+        self.render_clock()
+        
+        # start the journal over from what was just restored
+        self.checkpoint()
+        self.view.set(self.save_status_label, "text", "✓ Saved game restored")
     
-    def on_canvas_configure(self, event):
-        """When canvas is resized, resize the inner frame to match"""
-        width = event.width
-        self.canvas.itemconfig(self.canvas.find_withtag("all")[0], width=width)
+    def on_canvas_scroll(self, first, last):
+        """Keep the scrollbar in sync and show the timers that scrolled into view"""
+        self.scrollbar.set(first, last)
+        self.refresh_rows()
     
     def on_mousewheel(self, event):
         """Handle mousewheel scrolling"""
@@ -930,18 +1932,121 @@ class LacrosseTimerApp:
         """Create initial timers"""
         for i in range(1, self.timer_count + 1):
             self.create_timer(i)
+        self.refresh_rows()
+    
+    def create_timer(self, index, **fields):
+        """Add a timer, blank apart from the given fields; its row is bound when it scrolls into view"""
+        self.timer_data.add(index, **fields)
+        
+        # initialize timer values
+        self.engine.add_penalty(index)
+    
+    def clear_timer_data(self):
+        """Forget every timer, keeping the row widgets for reuse"""
+        self.timer_data.clear()
+        self.flashing.clear()
+        self.unbind_rows()
     
-    def create_timer(self, index):
-        """Create a new timer with the given index"""
+    def update_timer_fields(self, index, **fields):
+        """Change a timer's fields and push them to its row if it is on screen"""
+        self.timer_data.update(index, **fields)
+        row = self.shown_rows().get(index)
+        if row is not None:
+            row["binding"] = True
+            for key, value in fields.items():
+                row["vars"][key].set(value)
+            row["binding"] = False
+    
+    def on_row_edit(self, row, key):
+        """Copy an edit made in a row's widgets back to the timer it shows"""
+        if row["binding"] or row["index"] is None:
+            return
+        self.timer_data.update(row["index"], **{key: row["vars"][key].get()})
+        self.record_timer(row["index"], key)
+    
+    def unbind_rows(self, indexes=None):
+        """Detach rows from the given timers (or all) so they are rebound on the next refresh"""
+        for row in self.timer_rows:
+            if indexes is None or row["index"] in indexes:
+                self.visible_rows.pop(row["index"], None)
+                row["index"] = None
+    
+    def bind_row(self, row, index):
+        """Show a timer's fields in a row"""
+        row["index"] = index
+        row["binding"] = True
+        for key, var in row["vars"].items():
+            var.set(self.timer_data[index][key])
+        row["binding"] = False
+        self.view.set(row["frame"], "bg", "#FFCCCC" if index in self.flashing else "white")
+        self.view.set(row["time_display"], "text", self.seconds_to_hms(self.engine.penalty_remaining(index)))
+    
+    def refresh_rows(self):
+        """Lay out rows for the timers inside the viewport, building only as many rows as fit"""
+        if self.session is not self.shown:
+            return  # rows only ever show the field on screen
+        if self.row_pool.created == 0:
+            # the first row measures the row height, then build enough for a full screen
+            self.row_pool.prefill(1)
+            self.row_pool.prefill(self.root.winfo_screenheight() // self.row_height + 2)
+        
+        # scrollregion covers every timer even though most have no widgets
+        scroll_height = len(self.timer_order) * self.row_height
+        if scroll_height != self.scroll_height:
+            self.scroll_height = scroll_height
+            self.canvas.configure(scrollregion=(0, 0, 0, scroll_height))
+        
+        first = max(0, int(self.canvas.canvasy(0) // self.row_height))
+        count = max(0, min(len(self.timer_order) - first, self.canvas.winfo_height() // self.row_height + 2))
+        while len(self.timer_rows) < count:
+            self.timer_rows.append(self.row_pool.acquire())
+        while len(self.timer_rows) > count:
+            self.row_pool.release(self.timer_rows.pop())
+        
+        self.visible_rows = {}
+        for slot, row in enumerate(self.timer_rows):
+            position = first + slot
+            index = self.timer_order[position]
+            if row["index"] != index:
+                self.bind_row(row, index)
+            
+            # only touch the window item when its place or size really changed
+            y = position * self.row_height + 10
+            if row["y"] != y:
+                row["y"] = y
+                self.canvas.coords(row["window"], 10, y)
+            if row["width"] != self.row_width or row["hidden"]:
+                row["width"] = self.row_width
+                row["hidden"] = False
+                self.canvas.itemconfig(row["window"], width=self.row_width, state="normal")
+            self.visible_rows[index] = row
+    
+    def reset_timer_row(self, row):
+        """Blank a row and hide it so the pool can hand it out again"""
+        row["index"] = None
+        row["binding"] = True
+        row["vars"]["player_number"].set("")
+        row["vars"]["team_name"].set("")
+        row["vars"]["time_option"].set("Not in use")
+        row["vars"]["penalty_type"].set("Select Penalty Type")
+        row["vars"]["penalty_time"].set("")
+        row["binding"] = False
+        self.view.set(row["frame"], "bg", "white")
+        row["hidden"] = True
+        self.canvas.itemconfig(row["window"], state="hidden")
+    
+    def create_timer_row(self):
+        """Build one reusable timer row on the canvas"""
+        row = {"index": None, "binding": False, "y": None, "width": None, "hidden": True}
+        
         # create a frame for the timer
-        timer_frame = tk.Frame(self.timer_container, bg="white", bd=1, relief=tk.SOLID, padx=10, pady=10)
-        timer_frame.pack(fill=tk.X, padx=10, pady=10)
+        timer_frame = tk.Frame(self.canvas, bg="white", bd=1, relief=tk.SOLID, padx=10, pady=10)
         
         # add close button (X) to remove this specific timer
         close_btn = tk.Button(
             timer_frame,
             text="✕",
-            command=lambda idx=index: self.remove_specific_timer(idx),
+            command=lambda: self.remove_specific_timer(row["index"]),
             bg="white",
             fg="red",
             font=("Arial", 10, "bold"),
@@ -952,15 +2057,17 @@ class LacrosseTimerApp:
         close_btn.grid(row=0, column=2, sticky="ne")
         
         # player number input
+        player_var = tk.StringVar()
         player_label = tk.Label(timer_frame, text="Player Number:", bg="white")
         player_label.grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        player_entry = tk.Entry(timer_frame, width=20)
+        player_entry = tk.Entry(timer_frame, textvariable=player_var, width=20)
         player_entry.grid(row=0, column=1, sticky="w", padx=5, pady=5)
         
         # team name input
+        team_var = tk.StringVar()
         team_label = tk.Label(timer_frame, text="Team Name:", bg="white")
         team_label.grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        team_entry = tk.Entry(timer_frame, width=20)
+        team_entry = tk.Entry(timer_frame, textvariable=team_var, width=20)
         team_entry.grid(row=1, column=1, sticky="w", padx=5, pady=5)
         
         # time selection
@@ -984,7 +2091,7 @@ class LacrosseTimerApp:
         time_var = tk.StringVar(value=time_options[0])
         time_dropdown = ttk.Combobox(timer_frame, textvariable=time_var, values=time_options, state="readonly", width=18)
         time_dropdown.grid(row=2, column=1, sticky="w", padx=5, pady=5)
-        time_dropdown.bind("<<ComboboxSelected>>", lambda e, idx=index: self.setup_timer(idx))
+        time_dropdown.bind("<<ComboboxSelected>>", lambda e: self.setup_timer(row["index"]))
         
         # timer display
         time_display = tk.Label(timer_frame, text="00:00:00", font=("Arial", 16, "bold"), bg="white")
@@ -995,27 +2102,27 @@ class LacrosseTimerApp:
         button_frame.grid(row=4, column=0, columnspan=2, pady=5)
         
         start_btn = tk.Button(
-            button_frame, 
-            text="Start", 
-            command=lambda idx=index: self.start_timer(idx),
+            button_frame,
+            text="Start",
+            command=lambda: self.start_timer(row["index"]),
             bg="#007BFF",
             fg="white"
         )
         start_btn.pack(side=tk.LEFT, padx=5)
         
         stop_btn = tk.Button(
-            button_frame, 
-            text="Stop", 
-            command=lambda idx=index: self.stop_timer(idx),
+            button_frame,
+            text="Stop",
+            command=lambda: self.stop_timer(row["index"]),
             bg="#007BFF",
             fg="white"
         )
         stop_btn.pack(side=tk.LEFT, padx=5)
         
         released_btn = tk.Button(
-            button_frame, 
-            text="Released", 
-            command=lambda idx=index: self.released_timer(idx),
+            button_frame,
+            text="Released",
+            command=lambda: self.released_timer(row["index"]),
             bg="#007BFF",
             fg="white"
         )
@@ -1043,29 +2150,70 @@ class LacrosseTimerApp:
         penalty_dropdown.grid(row=5, column=1, sticky="w", padx=5, pady=5)
         
         # penalty time input
+        penalty_time_var = tk.StringVar()
         penalty_time_label = tk.Label(timer_frame, text="Time of Penalty:", bg="white")
         penalty_time_label.grid(row=6, column=0, sticky="w", padx=5, pady=5)
-        penalty_time_entry = tk.Entry(timer_frame, width=20)
+        penalty_time_entry = tk.Entry(timer_frame, textvariable=penalty_time_var, width=20)
         penalty_time_entry.grid(row=6, column=1, sticky="w", padx=5, pady=5)
         
-        # store references to widgets
-        self.timer_frames[index] = {
-            "frame": timer_frame,
-            "player_entry": player_entry,
-            "team_entry": team_entry,
-            "time_var": time_var,
-            "time_display": time_display,
-            "penalty_var": penalty_var,
-            "penalty_time_entry": penalty_time_entry,
-            "close_btn": close_btn  # store reference to close button
+        # edits flow back to whichever timer the row is showing
+        row["vars"] = {
+            "player_number": player_var,
+            "team_name": team_var,
+            "time_option": time_var,
+            "penalty_type": penalty_var,
+            "penalty_time": penalty_time_var
         }
+        for key, var in row["vars"].items():
+            var.trace_add("write", lambda *args, key=key: self.on_row_edit(row, key))
         
-        # initialize timer values
-        self.paused_times[index] = 0
+        # store references to widgets
+        row["frame"] = timer_frame
+        row["time_display"] = time_display
+        row["window"] = self.canvas.create_window(10, 10, window=timer_frame, anchor="nw", state="hidden")
+        
+        # every row is the same height, measure it once
+        if self.row_pool.created == 0:
+            timer_frame.update_idletasks()
+            self.row_height = timer_frame.winfo_reqheight() + 20
+        
+        return row
 
 def main():
+    parser = argparse.ArgumentParser(description="Lacrosse game and penalty timer")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print how long each startup phase took, up to the first drawn clock")
+    parser.add_argument("--season-report", metavar="FOLDER",
+                        help="without opening the app, write a report for every saved game in FOLDER plus a season summary")
+    parser.add_argument("--out", default="season_reports", help="folder for --season-report output")
+    parser.add_argument("--format", default="docx", choices=[extension[1:] for extension in WRITERS],
+                        help="report format for --season-report")
+    parser.add_argument("--workers", type=int, help="processes for --season-report (default: all cores)")
+    parser.add_argument("--engine-process", action="store_true",
+                        help="run each field's game clock in a separate process so a busy window never holds it up")
+    parser.add_argument("--serve", type=int, nargs="?", const=8765, metavar="PORT",
+                        help="serve a live scoreboard page on PORT (default 8765) and JSON deltas over TCP on PORT+1")
+    args = parser.parse_args()
+    
+    if args.season_report:
+        from laxExport import season_report
+        season_report(args.season_report, args.out, "." + args.format, args.workers)
+        return
+    
+    startup = StartupTimer(IMPORT_STARTED)
+    startup.mark("import")
+    scoreboard = None
+    if args.serve is not None:
+        # asyncio is only worth loading when displays are being served
+        from laxServer import ScoreboardServer
+        scoreboard = ScoreboardServer(http_port=args.serve, tcp_port=args.serve + 1).start()
+        startup.mark("scoreboard server")
     root = tk.Tk()
-    app = LacrosseTimerApp(root)
+    app = LacrosseTimerApp(root, startup, scoreboard, args.engine_process)
+    root.update_idletasks()
+    startup.mark("first frame")
+    if args.profile_startup:
+        startup.report()
     
     # start the app
     root.mainloop()
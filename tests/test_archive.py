@@ -0,0 +1,72 @@
+import pytest
+
+from laxArchive import GameArchive
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = GameArchive(str(tmp_path / "archive.db"))
+    first = archive.start_game(720)
+    archive.add_penalty(first, 1, "12", "Hawks", "Slashing", "10:15", 60)
+    archive.add_penalty(first, 2, "7", "Owls", "Holding", "08:00", 30)
+    archive.add_penalty(first, 3, "12", "Hawks", "Tripping", "02:30", 120)
+    second = archive.start_game(720)
+    archive.add_penalty(second, 1, "4", "Owls", "Slashing", "11:00", 180)
+    archive.add_penalty(second, 2, "12", "Owls", "Slashing", "05:45", 60)
+    yield archive
+    archive.close()
+
+
+def query_plan(archive, query, params=()):
+    return " ".join(row[-1] for row in archive.db.execute("EXPLAIN QUERY PLAN " + query, params))
+
+
+def test_penalty_minutes_by_team(archive):
+    assert archive.penalty_minutes_by_team() == [("Owls", 4.5), ("Hawks", 3.0)]
+    assert archive.penalty_minutes_by_team(1) == [("Hawks", 3.0), ("Owls", 0.5)]
+    assert archive.penalty_minutes_by_team(2) == [("Owls", 4.0)]
+
+
+def test_penalties_by_type(archive):
+    assert archive.penalties_by_type()[0] == ("Slashing", 3, 5.0)
+    assert sorted(archive.penalties_by_type()[1:]) == [("Holding", 1, 0.5), ("Tripping", 1, 2.0)]
+
+
+def test_player_history_is_newest_first(archive):
+    assert [row[:4] for row in archive.player_history("12")] == [
+        (2, 2, "Owls", "Slashing"),
+        (1, 3, "Hawks", "Tripping"),
+        (1, 1, "Hawks", "Slashing")
+    ]
+    assert [row[3] for row in archive.player_history("12", team="Hawks")] == ["Tripping", "Slashing"]
+    assert archive.player_history("99") == []
+
+
+def test_iter_penalty_rows_formats_durations(archive):
+    assert list(archive.iter_penalty_rows(1)) == [
+        ("12", "Hawks", "Slashing", "10:15", "00:01:00"),
+        ("7", "Owls", "Holding", "08:00", "00:00:30"),
+        ("12", "Hawks", "Tripping", "02:30", "00:02:00")
+    ]
+    assert len(list(archive.iter_penalty_rows())) == 5
+
+
+def test_update_penalty_changes_the_stored_columns(archive):
+    penalty_id = archive.game_penalties(1)[1][0]
+    archive.update_penalty(penalty_id, player="9", duration=90, release="07:30")
+    archive.update_penalty(penalty_id)
+    assert archive.player_history("7") == []
+    assert archive.player_history("9") == [(1, 2, "Owls", "Holding", "08:00", 90, "07:30")]
+    assert archive.penalty_minutes_by_team(1) == [("Hawks", 3.0), ("Owls", 1.5)]
+    assert archive.game_penalties(1)[1][1:] == ("9", "Owls", "Holding", "08:00", 90)
+
+
+def test_queries_use_the_indexes(archive):
+    assert "penalties_team" in query_plan(
+        archive, "SELECT team, SUM(duration) / 60.0 FROM penalties GROUP BY team ORDER BY 2 DESC")
+    assert "penalties_player" in query_plan(
+        archive, "SELECT game_id FROM penalties WHERE player = ? ORDER BY id DESC", ("12",))
+    assert "penalties_game" in query_plan(
+        archive, "SELECT player FROM penalties WHERE game_id = ? ORDER BY id", (1,))
+    assert "penalties_type" in query_plan(
+        archive, "SELECT penalty_type, COUNT(*) FROM penalties GROUP BY penalty_type")
@@ -0,0 +1,196 @@
+import pytest
+
+from laxEngine import GameClockEngine, PenaltyStore, VirtualClock, simulate_game
+
+
+def make_engine(quarter_length=600, **kwargs):
+    """An engine on a VirtualClock, with every event it emits collected"""
+    clock = VirtualClock()
+    engine = GameClockEngine(quarter_length, clock=clock, **kwargs)
+    events = []
+    engine.subscribe(lambda event, data: events.append((event, data)))
+    return engine, clock, events
+
+
+def expired(events):
+    return [data["index"] for event, data in events if event == "penalty_expired"]
+
+
+def test_penalty_expires_exactly_when_its_time_runs_out():
+    engine, clock, events = make_engine()
+    engine.add_penalty(1, 30)
+    engine.add_penalty(2, 45)
+    engine.start()
+    engine.start_penalty(1)
+    clock.advance(10)
+    engine.start_penalty(2)
+
+    assert engine.next_release() == (1, 20.0)
+    clock.advance(19.999)
+    engine.tick()
+    assert expired(events) == []
+    assert engine.penalty_remaining(1) == pytest.approx(0.001)
+
+    clock.advance(0.001)
+    engine.tick()
+    assert expired(events) == [1]
+    assert engine.penalty_remaining(1) == 0
+    assert engine.game_elapsed == pytest.approx(30.0)
+    assert engine.next_release() == (2, pytest.approx(25.0))
+
+
+def test_waking_at_time_until_change_lands_on_every_expiry():
+    engine, clock, events = make_engine()
+    for index, seconds in ((1, 12.5), (2, 30), (3, 61.25)):
+        engine.add_penalty(index, seconds)
+    engine.start()
+    engine.start_all_penalties()
+
+    expired_at = {}
+    while len(expired_at) < 3:
+        clock.advance(engine.time_until_change(1.0))
+        engine.tick()
+        for index in expired(events):
+            expired_at.setdefault(index, engine.game_elapsed)
+    assert expired_at == {1: pytest.approx(12.5), 2: pytest.approx(30.0), 3: pytest.approx(61.25)}
+
+
+def test_stopped_clock_holds_penalties():
+    engine, clock, events = make_engine()
+    engine.add_penalty(1, 30)
+    engine.start()
+    engine.start_penalty(1)
+    clock.advance(10)
+    engine.stop()
+    clock.advance(100)
+    assert engine.penalty_remaining(1) == 20
+    assert engine.next_release() is None
+    assert expired(events) == []
+
+
+def test_held_penalty_resumes_after_the_quarter_break():
+    engine, clock, events = make_engine(quarter_length=60)
+    engine.add_penalty(1, 75)
+    engine.start()
+    engine.start_penalty(1)
+    clock.advance(60)
+    engine.tick()
+
+    assert ("quarter_end", {"quarter": 1}) in events
+    assert engine.paused_between_quarters
+    assert not engine.running
+    assert engine.penalty_remaining(1) == 15
+
+    clock.advance(300)  # the break itself costs the penalty nothing
+    assert engine.next_quarter()
+    engine.start()
+    assert engine.penalties.is_running(1)
+    assert engine.next_release() == (1, 15)
+
+    clock.advance(15)
+    engine.tick()
+    assert expired(events) == [1]
+    assert engine.remaining() == 45
+
+
+def test_editing_a_held_penalty_over_the_break_moves_its_expiry():
+    engine, clock, events = make_engine(quarter_length=60)
+    engine.add_penalty(1, 75)
+    engine.start()
+    engine.start_penalty(1)
+    clock.advance(60)
+    engine.tick()
+
+    engine.set_penalty(1, 120)
+    assert engine.next_release() == (1, 120)
+    engine.next_quarter()
+    engine.start()
+    clock.advance(60)
+    engine.tick()
+    assert expired(events) == []
+    assert engine.penalty_remaining(1) == 60
+
+
+def test_stopping_the_clock_over_the_break_keeps_held_expiries():
+    engine, clock, events = make_engine(quarter_length=60)
+    engine.add_penalty(1, 75)
+    engine.start()
+    engine.start_penalty(1)
+    clock.advance(60)
+    engine.tick()
+
+    engine.stop()  # the operator presses Stop during the break
+    assert engine.paused_between_quarters
+    assert engine.next_release() == (1, 15)
+    engine.next_quarter()
+    engine.start()
+    clock.advance(15)
+    engine.tick()
+    assert expired(events) == [1]
+
+
+def test_adjust_all_clamps_at_zero_and_only_touches_active_penalties():
+    engine, clock, events = make_engine(quarter_length=60)
+    engine.add_penalty(1, 30)
+    engine.add_penalty(2, 5)
+    engine.add_penalty(3, 0)
+    engine.start()
+    engine.start_all_penalties()
+
+    engine.adjust_all(-10)
+    assert engine.remaining() == 50
+    assert engine.penalty_remaining(1) == 20
+    assert engine.penalty_remaining(2) == 0
+    assert not engine.penalties.is_running(2)
+    assert engine.penalty_remaining(3) == 0
+
+    engine.adjust_all(15)
+    assert engine.penalty_remaining(1) == 35
+    assert engine.penalty_remaining(3) == 0  # a timer with no time stays unused
+    assert engine.next_release() == (1, 35)
+
+    engine.adjust_all(-1000)
+    assert engine.remaining() == 0
+    assert engine.penalty_remaining(1) == 0
+
+
+def test_game_over_after_the_fourth_quarter():
+    engine, clock, events = make_engine(quarter_length=60)
+    for quarter in range(1, 5):
+        assert engine.quarter == quarter
+        engine.start()
+        clock.advance(60)
+        engine.tick()
+        if quarter < 4:
+            assert events[-1] == ("quarter_end", {"quarter": quarter})
+            assert engine.next_quarter()
+    assert events[-1] == ("game_over", {})
+    assert not engine.next_quarter()
+    assert [event for event, data in events].count("quarter_end") == 3
+
+
+def test_simulated_game_plays_every_quarter():
+    engine = simulate_game(quarter_length=120, penalties=10, step=1.0)
+    assert engine.quarter == 4
+    assert engine.remaining() == 0
+    assert all(engine.penalty_remaining(index) == 0 for index in range(10))
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_penalty_store_reuses_slots_and_advances_running_timers(use_numpy):
+    store = PenaltyStore(use_numpy)
+    for index in range(40):  # past the initial capacity
+        store.add(index, index + 1)
+    store.remove(3)
+    store.add(100, 7)
+    assert store.slots[100] == 3
+    assert len(store) == 40
+
+    store.start(0)
+    store.start(100)
+    assert sorted(store.running_indexes()) == [0, 100]
+    assert store.advance(2) == [0]
+    assert store.get(100) == 5
+    assert store.running_indexes() == [100]
+    store.stop_all()
+    assert store.running_indexes() == []
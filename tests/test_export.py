@@ -0,0 +1,136 @@
+import csv
+import json
+import sys
+import time
+import zipfile
+
+import pytest
+
+from laxExport import REPORT_COLUMNS, WRITERS, export_rows
+
+ROWS = [
+    ("12", "Hawks", "Slashing", "00:03:10", "00:01:00"),
+    ("7", "Owls & Co", "Tripping <major>", "00:05:00", "Not in use"),
+    (3, None, "Holding", "", "00:00:30")
+]
+SUMMARY = ["Quarter: 2", "Quarter Length: 12 minutes"]
+
+
+def test_csv(tmp_path):
+    path = tmp_path / "report.csv"
+    assert export_rows(str(path), ROWS, SUMMARY) == 3
+    with open(path, newline="", encoding="utf-8") as f:
+        lines = list(csv.reader(f))
+    assert lines[0] == list(REPORT_COLUMNS)
+    assert lines[1] == list(ROWS[0])
+    assert lines[3] == ["3", "", "Holding", "", "00:00:30"]
+
+
+def test_jsonl(tmp_path):
+    path = tmp_path / "report.jsonl"
+    assert export_rows(str(path), ROWS, SUMMARY) == 3
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert records[1]["team_name"] == "Owls & Co"
+    assert records[2]["player_number"] == "3"
+
+
+def test_html_escapes_values(tmp_path):
+    path = tmp_path / "report.html"
+    assert export_rows(str(path), ROWS, SUMMARY, title="Final <b>") == 3
+    page = path.read_text(encoding="utf-8")
+    assert "<td>Tripping &lt;major&gt;</td>" in page
+    assert "<td>Owls &amp; Co</td>" in page
+    assert "<h1>Final &lt;b&gt;</h1>" in page
+    assert "<p>Quarter: 2</p>" in page
+
+
+def test_docx(tmp_path):
+    path = tmp_path / "report.docx"
+    assert export_rows(str(path), iter(ROWS), SUMMARY) == 3
+    with zipfile.ZipFile(path) as package:
+        assert package.testzip() is None
+        document = package.read("word/document.xml").decode("utf-8")
+    assert document.count("<w:tr>") == 4  # header and three rows
+    assert "Tripping &lt;major&gt;" in document
+    assert "Quarter: 2" in document
+
+    docx = pytest.importorskip("docx")
+    table = docx.Document(str(path)).tables[0]
+    assert [cell.text for cell in table.rows[0].cells] == list(REPORT_COLUMNS)
+    assert [cell.text for cell in table.rows[2].cells] == list(ROWS[1])
+
+
+def test_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        export_rows(str(tmp_path / "report.pdf"), ROWS)
+    assert ".pdf" not in WRITERS
+
+
+def test_row_exports_work_without_python_docx(tmp_path, monkeypatch):
+    from laxArchive import GameArchive
+    from laxExport import ReportBuilder
+
+    monkeypatch.setitem(sys.modules, "docx", None)  # import docx now raises ImportError
+    archive = GameArchive(str(tmp_path / "archive.db"))
+    game_id = archive.start_game(600)
+    archive.add_penalty(game_id, 1, "12", "Hawks", "Slashing", "00:03:10", 60)
+    builder = ReportBuilder()
+    builder.export_rows(str(tmp_path / "game.csv"), {"quarter": 1, "quarter_length": 600}, archive.path, game_id)
+    results = []
+    while builder.progress() is not None or builder.results:
+        results.extend(builder.take_results())
+        time.sleep(0.01)
+    archive.close()
+
+    assert results == [("saved", str(tmp_path / "game.csv"))]
+    assert (tmp_path / "game.csv").read_text(encoding="utf-8").splitlines()[1] == "12,Hawks,Slashing,00:03:10,00:01:00"
+
+
+def test_exports_queued_back_to_back_each_report_their_result(tmp_path):
+    from laxArchive import GameArchive
+    from laxExport import ReportBuilder
+
+    archive = GameArchive(str(tmp_path / "archive.db"))
+    game_id = archive.start_game(600)
+    archive.add_penalty(game_id, 1, "12", "Hawks", "Slashing", "00:03:10", 60)
+    summary = {"quarter": 1, "quarter_length": 600}
+
+    builder = ReportBuilder()
+    builder.set_penalty(1, ROWS[0])
+    builder.export(str(tmp_path / "game.docx"), summary)
+    builder.export_rows(str(tmp_path / "game.csv"), summary, archive.path, game_id)
+    builder.export_rows(str(tmp_path / "missing" / "game.html"), summary, archive.path, game_id)
+    results = []
+    while builder.progress() is not None or builder.results:
+        results.extend(builder.take_results())
+        time.sleep(0.01)
+    archive.close()
+
+    assert results[:2] == [("saved", str(tmp_path / "game.docx")), ("saved", str(tmp_path / "game.csv"))]
+    assert results[2][0] == "error"
+    assert builder.take_results() == []
+
+
+def test_season_report_keeps_team_totals_for_row_formats(tmp_path):
+    from laxExport import season_report
+    from laxStore import empty_state
+
+    games = tmp_path / "games"
+    games.mkdir()
+    for number, (team, minutes) in enumerate((("Hawks", "00:01:00"), ("Hawks", "00:02:00"), ("Owls", "00:00:30"))):
+        state = empty_state()
+        state["timers"] = {"1": {"player_number": "7", "team_name": team, "penalty_type": "Slashing",
+                                 "penalty_time": "00:05:00", "time_option": minutes}}
+        (games / f"game{number}.json").write_text(json.dumps(state), encoding="utf-8")
+
+    for extension in (".csv", ".jsonl"):
+        out = tmp_path / extension[1:]
+        assert season_report(str(games), str(out), extension, workers=1) == 3
+        totals = (out / f"season_totals{extension}").read_text(encoding="utf-8").splitlines()
+        if extension == ".csv":
+            assert totals == ["Team Name,Penalty Minutes", "Hawks,3.0", "Owls,0.5"]
+        else:
+            assert [json.loads(line) for line in totals] == [
+                {"team_name": "Hawks", "penalty_minutes": 3.0}, {"team_name": "Owls", "penalty_minutes": 0.5}
+            ]
@@ -0,0 +1,53 @@
+import pytest
+
+from laxEngine import VirtualClock
+from laxMetrics import Histogram, TickMetrics
+
+
+def test_histogram_percentiles_and_prometheus_text():
+    histogram = Histogram("lax_test_seconds", "test", (0.001, 0.01, 0.1))
+    for value in (0.0005, 0.002, 0.003, 0.05, 0.5):
+        histogram.observe(value)
+    assert histogram.percentile(0.2) == 0.001
+    assert histogram.percentile(0.6) == 0.01
+    assert histogram.percentile(1.0) == 0.5
+    text = histogram.prometheus()
+    assert 'lax_test_seconds_bucket{le="0.01"} 3' in text
+    assert 'lax_test_seconds_bucket{le="+Inf"} 5' in text
+
+
+def test_tick_lateness_is_measured_from_the_scheduled_moment():
+    clock = VirtualClock()
+    metrics = TickMetrics(clock)
+    metrics.scheduled(1.0)
+    clock.advance(1.25)
+    started = metrics.tick_started()
+    clock.advance(0.002)
+    metrics.tick_finished(started)
+    assert metrics.lateness.max == 0.25
+    assert metrics.handler.max == pytest.approx(0.002)
+
+
+def test_drift_is_how_long_a_clock_value_stayed_up_after_it_went_stale():
+    metrics = TickMetrics()
+    metrics.sample_drift("Field 1", "09:59", 598, 598.5)
+    metrics.sample_drift("Field 1", "09:59", 598, 598.1)  # same text, nothing replaced
+    assert metrics.drift.count == 0
+
+    metrics.sample_drift("Field 1", "09:58", 597, 597.99)  # drawn on time
+    metrics.sample_drift("Field 1", "09:56", 595, 595.3)  # a blocked loop skipped 09:57
+    assert metrics.drift.count == 2
+    assert metrics.drift_now["Field 1"] == 597 - 595.3
+    assert metrics.drift.max == 597 - 595.3
+
+
+def test_set_clocks_and_other_fields_do_not_count_as_drift():
+    metrics = TickMetrics()
+    metrics.sample_drift("Field 1", "09:59", 598, 598.5)
+    metrics.clock_changed("Field 1")
+    metrics.sample_drift("Field 1", "09:40", 579, 579.5)  # adjusted by hand
+    metrics.sample_drift("Field 2", "05:00", 299, 299.5)  # switched to another field
+    metrics.sample_drift("Field 2", "04:59", 298, 298.75)
+    assert metrics.drift.count == 1
+    assert "Field 1" not in metrics.drift_now
+    assert 'lax_clock_drift_current_seconds{field="Field 2"} 0.250000000' in metrics.prometheus()
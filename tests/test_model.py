@@ -0,0 +1,52 @@
+import pytest
+
+from laxModel import TIMER_FIELDS, TimerStore
+
+
+def test_old_snapshots_never_change():
+    store = TimerStore()
+    store.add(2, player_number="12")
+    before = store.snapshot
+
+    store.add(1, player_number="7")
+    store.update(2, team_name="Hawks")
+    store.remove(2)
+    store.add(3)
+
+    assert list(before) == [2]
+    assert before[2] == dict(TIMER_FIELDS, player_number="12")
+    assert 1 not in before
+    assert list(store) == [1, 3]
+    assert store[1]["player_number"] == "7"
+    with pytest.raises(TypeError):
+        before[2]["team_name"] = "Owls"  # records are read-only views
+
+
+def test_order_stays_sorted():
+    store = TimerStore()
+    for index in (5, 1, 9, 3, 7):
+        store.add(index)
+    assert store.order == (1, 3, 5, 7, 9)
+
+    store.add(3, player_number="4")  # re-adding keeps one place in the order
+    store.remove(7)
+    store.add(2)
+    assert store.order == (1, 2, 3, 5, 9)
+    assert store[3]["player_number"] == "4"
+    assert len(store) == 5
+
+
+def test_version_increments_on_each_change():
+    store = TimerStore()
+    versions = [store.snapshot.version]
+    store.add(1)
+    versions.append(store.snapshot.version)
+    store.update(1, player_number="12")
+    versions.append(store.snapshot.version)
+    store.remove(1)
+    versions.append(store.snapshot.version)
+    store.clear()
+    versions.append(store.snapshot.version)
+
+    assert versions == [0, 1, 2, 3, 4]
+    assert len(store) == 0
@@ -0,0 +1,69 @@
+import json
+
+from laxServer import ScoreboardServer, flatten
+
+
+def board(clock, **penalties):
+    return {"Field 1": {"quarter": 2, "clock": clock, "penalty": penalties}}
+
+
+def recording_server():
+    """A server that never starts its loop, keeping every message it would send"""
+    server = ScoreboardServer()
+    sent = []
+    server.broadcast = lambda clients, payload: sent.append((clients, payload))
+    return server, sent
+
+
+def messages(server, sent):
+    """The TCP messages decoded, checking the SSE copy carries the same JSON"""
+    decoded = []
+    for (tcp_clients, line), (sse_clients, event) in zip(sent[::2], sent[1::2]):
+        assert tcp_clients is server.tcp_clients and sse_clients is server.sse_clients
+        assert event == b"data: " + line.rstrip(b"\n") + b"\n\n"
+        decoded.append(json.loads(line))
+    return decoded
+
+
+def test_flatten_names_nested_values_by_path():
+    assert flatten(board("10:00", **{"3": {"player": "12", "remaining": "01:00"}})) == {
+        "Field 1/quarter": 2,
+        "Field 1/clock": "10:00",
+        "Field 1/penalty/3/player": "12",
+        "Field 1/penalty/3/remaining": "01:00"
+    }
+    assert flatten({"a": {}}) == {}
+
+
+def test_apply_sends_only_what_changed():
+    server, sent = recording_server()
+    server.apply(board("10:00", **{"3": {"player": "12", "remaining": "01:00"}}))
+    server.apply(board("09:59", **{"3": {"player": "12", "remaining": "00:59"}}))
+    server.apply(board("09:58"))
+
+    first, second, third = messages(server, sent)
+    assert first["seq"] == 1 and "del" not in first
+    assert first["set"]["Field 1/penalty/3/player"] == "12"
+    assert second == {"seq": 2, "set": {"Field 1/clock": "09:59", "Field 1/penalty/3/remaining": "00:59"}}
+    assert third == {
+        "seq": 3,
+        "set": {"Field 1/clock": "09:58"},
+        "del": ["Field 1/penalty/3/player", "Field 1/penalty/3/remaining"]
+    }
+    assert server.current == {"Field 1/quarter": 2, "Field 1/clock": "09:58"}
+
+
+def test_apply_sends_nothing_when_nothing_changed():
+    server, sent = recording_server()
+    server.apply(board("10:00"))
+    del sent[:]
+    server.apply(board("10:00"))
+    assert sent == []
+    assert server.seq == 1
+
+
+def test_full_message_matches_the_deltas_sent():
+    server, sent = recording_server()
+    server.apply(board("10:00", **{"3": {"player": "12"}}))
+    server.apply(board("09:59"))
+    assert json.loads(server.full_message()) == {"seq": 2, "full": {"Field 1/quarter": 2, "Field 1/clock": "09:59"}}
@@ -0,0 +1,123 @@
+import os
+import signal
+import time
+
+import laxShared
+from laxShared import SharedEngine
+from laxStore import pack_snapshot, unpack_snapshot
+
+
+def make_engine(quarter_length=600):
+    engine = SharedEngine(quarter_length)
+    events = []
+    engine.subscribe(lambda event, data: events.append((event, data)))
+    return engine, events
+
+
+def test_engine_process_runs_commands_and_publishes_state():
+    engine, events = make_engine()
+    try:
+        engine.add_penalty(1, 30)
+        engine.start()
+        engine.start_penalty(1)
+        assert engine.running
+        assert ("started", {}) in events
+        assert 29 < engine.penalty_remaining(1) <= 30
+        assert engine.next_release()[0] == 1
+        engine.adjust_all(-10)
+        assert 19 < engine.penalty_remaining(1) <= 20
+        assert engine.take_failure() is None
+    finally:
+        engine.close()
+
+
+def test_clock_carries_on_in_this_process_when_the_engine_dies():
+    engine, events = make_engine()
+    try:
+        engine.add_penalty(1, 0.5)
+        engine.add_penalty(2, 60)
+        engine.start()
+        engine.start_penalty(1)
+        engine.process.kill()
+        engine.process.join()
+
+        engine.tick()
+        failure = engine.take_failure()
+        assert "engine process lost" in failure
+        assert engine.take_failure() is None
+        assert engine.running
+        assert 599 < engine.remaining() < 600
+        assert engine.penalty_remaining(2) == 60
+
+        time.sleep(0.6)
+        engine.tick()
+        assert ("penalty_expired", {"index": 1}) in events
+        engine.stop()
+        assert not engine.running
+    finally:
+        engine.close()
+
+
+def test_engine_that_never_starts_is_replaced(monkeypatch):
+    # the spawned process calls this with the wrong arguments and exits straight away
+    monkeypatch.setattr(laxShared, "run_engine", os._exit)
+    engine, events = make_engine(120)
+    try:
+        assert "exited on start" in engine.take_failure()
+        assert engine.remaining() == 120
+        engine.add_penalty(1, 10)
+        engine.start()
+        assert ("started", {}) in events
+        assert engine.running
+    finally:
+        engine.close()
+
+
+def test_hung_engine_is_replaced(monkeypatch):
+    monkeypatch.setattr(laxShared, "CALL_TIMEOUT", 0.2)
+    engine, events = make_engine()
+    try:
+        engine.add_penalty(1, 30)
+        os.kill(engine.process.pid, signal.SIGSTOP)
+        engine.start()
+        assert "no reply to start" in engine.take_failure()
+        assert not engine.process.is_alive()
+        assert engine.running
+        assert engine.penalty_remaining(1) == 30
+    finally:
+        engine.close()
+
+
+def test_penalty_held_over_the_break_survives_the_engine():
+    engine, events = make_engine(1)
+    try:
+        engine.add_penalty(1, 5)
+        engine.start()
+        engine.start_penalty(1)
+        time.sleep(1.1)
+        engine.tick()
+        assert ("quarter_end", {"quarter": 1}) in events
+        engine.process.kill()
+        engine.process.join()
+
+        assert engine.next_quarter()
+        assert engine.take_failure() is not None
+        engine.start()
+        assert engine.quarter == 2
+        assert 3.9 < engine.penalty_remaining(1) < 4.1
+        assert engine.next_release()[0] == 1
+    finally:
+        engine.close()
+
+
+def test_quarter_length_reads_back_in_whole_seconds():
+    engine, events = make_engine(720)
+    try:
+        assert engine.quarter_length == 720 and isinstance(engine.quarter_length, int)
+        assert f"{engine.quarter_length // 60} minutes" == "12 minutes"
+        # the binary snapshot packs it as an integer
+        state = {"quarter": engine.quarter, "quarter_length": engine.quarter_length,
+                 "game_clock_time": engine.remaining(), "timers": {}}
+        assert unpack_snapshot(pack_snapshot(state))["quarter_length"] == 720
+    finally:
+        engine.close()
@@ -0,0 +1,162 @@
+import json
+import os
+import time
+
+from laxStore import (GameJournal, SnapshotWriter, apply_record, empty_state, pack_snapshot, read_snapshot,
+                      unpack_snapshot, write_atomic)
+
+
+def timer(player, team, paused_time, archive_id=None):
+    return {
+        "player_number": player,
+        "team_name": team,
+        "penalty_type": "Slashing",
+        "penalty_time": "00:01:00",
+        "time_option": "1 Minute",
+        "paused_time": paused_time,
+        "archive_id": archive_id
+    }
+
+
+def make_journal(folder, binary=False, **kwargs):
+    return GameJournal(
+        snapshot_path=str(folder / "game.json"),
+        journal_path=str(folder / "game.journal"),
+        binary_path=str(folder / "game.lax"),
+        binary=binary,
+        writer=SnapshotWriter(delay=0, max_delay=0),
+        **kwargs
+    )
+
+
+def compact_and_reload(folder, binary):
+    """Compact a two-record journal, add one more record, then load it all back"""
+    journal = make_journal(folder, binary=binary, compact_every=2)
+    state = empty_state()
+    for record in ({"op": "timer", "index": 1, **timer("12", "Hawks", 60)}, {"op": "game", "quarter": 2}):
+        apply_record(state, record)
+        journal.append(record)
+    assert journal.needs_compaction()
+    journal.compact(dict(state, timers={key: dict(value) for key, value in state["timers"].items()}))
+    journal.append({"op": "times", "game_clock_time": 300, "timers": {"1": 20}})
+    journal.close()
+    journal.writer.close()  # a shared writer is closed by whoever made it
+    assert journal.segments() == [1]
+
+    reloaded = make_journal(folder)
+    state = reloaded.load()
+    reloaded.close()
+    reloaded.writer.close()
+    assert reloaded.binary == binary
+    assert state["quarter"] == 2
+    assert state["game_clock_time"] == 300
+    assert state["timers"]["1"]["player_number"] == "12"
+    assert state["timers"]["1"]["paused_time"] == 20
+
+
+def test_replaying_a_record_twice_lands_on_the_same_state():
+    state = empty_state()
+    records = [
+        {"op": "timer", "index": 1, "player_number": "7", "paused_time": 60},
+        {"op": "times", "game_clock_time": 500, "timers": {"1": 42}},
+        {"op": "game", "quarter": 2}
+    ]
+    for record in records + records:
+        apply_record(state, record)
+    assert state["quarter"] == 2
+    assert state["game_clock_time"] == 500
+    assert state["timers"] == {"1": {"player_number": "7", "paused_time": 42}}
+
+    apply_record(state, {"op": "remove", "index": 1})
+    assert state["timers"] == {}
+    apply_record(state, {"op": "timer", "index": 2})
+    apply_record(state, {"op": "clear"})
+    assert state["timers"] == {}
+
+
+def test_journal_replays_records_after_a_crash(tmp_path):
+    journal = make_journal(tmp_path)
+    journal.append({"op": "game", "quarter": 2, "quarter_length": 600})
+    journal.append({"op": "timer", "index": 1, **timer("12", "Hawks", 60)})
+    journal.append({"op": "times", "game_clock_time": 480, "timers": {"1": 15}})
+    journal.file.close()  # no sync, no snapshot: the process just died
+    journal.writer.close()
+
+    state = make_journal(tmp_path).load()
+    assert state["quarter"] == 2
+    assert state["game_clock_time"] == 480
+    assert state["timers"]["1"]["paused_time"] == 15
+
+
+def test_journal_ignores_a_torn_last_line(tmp_path):
+    journal = make_journal(tmp_path)
+    journal.append({"op": "game", "quarter": 3})
+    journal.close()
+    journal.writer.close()
+    with open(tmp_path / "game.journal", "a", encoding="utf-8") as f:
+        f.write('{"op":"game","quar')
+    assert make_journal(tmp_path).load()["quarter"] == 3
+
+
+def test_compaction_replaces_old_segments_with_a_snapshot(tmp_path):
+    compact_and_reload(tmp_path, binary=False)
+    assert os.path.exists(tmp_path / "game.json")
+    assert read_snapshot(str(tmp_path / "game.json"))["generation"] == 1
+
+
+def test_binary_snapshot_round_trip():
+    state = empty_state()
+    state.update(quarter=3, game_clock_time=123.5, show_tenths=True, archive_game_id=9, generation=4)
+    state["timers"] = {"1": timer("12", "Hawks", 30.25, archive_id=5), "7": timer("3", "Hawks ü", 0)}
+    decoded = unpack_snapshot(pack_snapshot(state))
+    assert decoded["timers"] == state["timers"]
+    for key in ("quarter", "quarter_length", "game_clock_time", "show_tenths", "archive_game_id", "generation"):
+        assert decoded[key] == state[key]
+
+
+def test_binary_compaction_loads_back_without_the_binary_flag(tmp_path):
+    compact_and_reload(tmp_path, binary=True)
+    assert os.path.exists(tmp_path / "game.lax")
+    with open(tmp_path / "game.lax", "rb") as f:
+        assert unpack_snapshot(f.read())["generation"] == 1
+
+
+def wait_until_idle(writer, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while writer.busy() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_snapshot_writer_coalesces_a_burst_into_one_write(tmp_path):
+    path = str(tmp_path / "game.json")
+    writer = SnapshotWriter(delay=0.2, max_delay=5.0)
+    write = lambda state: write_atomic(path, json.dumps(state).encode("utf-8"))
+    for quarter in range(1, 6):
+        writer.submit({"quarter": quarter}, write)
+    wait_until_idle(writer)
+    writer.close()
+
+    assert writer.submitted == 5
+    assert writer.written == 1
+    assert writer.error is None
+    assert read_snapshot(path) == {"quarter": 5}
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_snapshot_writer_writes_by_max_delay_during_a_steady_stream(tmp_path):
+    path = str(tmp_path / "game.json")
+    writer = SnapshotWriter(delay=0.2, max_delay=0.3)
+    write = lambda state: write_atomic(path, json.dumps(state).encode("utf-8"))
+    started = time.monotonic()
+    submitted = 0
+    while time.monotonic() - started < 0.8:  # never quiet for the 0.2 s delay
+        submitted += 1
+        writer.submit({"saves": submitted}, write)
+        time.sleep(0.05)
+    assert writer.written >= 1
+    written_while_streaming = writer.written
+    wait_until_idle(writer)
+    writer.close()
+
+    assert written_while_streaming <= writer.written < submitted
+    assert read_snapshot(path) == {"saves": submitted}